@@ -0,0 +1,140 @@
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+import main as analyzer
+from log_generator import generate_mission_log
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없다.
+    resource = None
+
+
+STAGES = ['read_log_file', 'parse_logs', 'save_logs', 'extract_logs', 'generate_report', 'run_streaming']
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS(MB)를 반환한다. 측정할 수 없으면 None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위로 반환한다.
+    return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+def _run_stage(stage, log_file, work_dir, queue):
+    """새 프로세스에서 한 단계를 실행하고 (소요 시간, 준비 후 RSS, 최대 RSS)를 보낸다.
+
+    단계마다 프로세스를 새로 띄우므로 앞 단계의 메모리 사용량이 섞이지 않는다.
+    측정 대상 단계에 필요한 입력(예: 파싱된 로그)은 타이머 밖에서 준비한다.
+    """
+    lines = entries = None
+    if stage != 'read_log_file' and stage != 'run_streaming':
+        lines = analyzer.read_log_file(log_file)
+    if stage in ('save_logs', 'extract_logs', 'generate_report'):
+        entries = analyzer.parse_logs(lines)
+    rss_before = peak_rss_mb()
+
+    start_time = time.perf_counter()
+    if stage == 'read_log_file':
+        analyzer.read_log_file(log_file)
+    elif stage == 'parse_logs':
+        analyzer.parse_logs(lines)
+    elif stage == 'save_logs':
+        analyzer.save_logs(entries, os.path.join(work_dir, 'sorted_logs.txt'), sort=True, reverse=True)
+    elif stage == 'extract_logs':
+        analyzer.extract_logs(entries, 'explosion')
+    elif stage == 'generate_report':
+        analyzer.generate_report(entries, os.path.join(work_dir, 'log_analysis.md'))
+    elif stage == 'run_streaming':
+        analyzer.run_streaming(
+            log_file,
+            os.path.join(work_dir, 'sorted_logs.txt'),
+            os.path.join(work_dir, 'critical_logs.txt'),
+            os.path.join(work_dir, 'log_analysis.md'),
+        )
+    elapsed = time.perf_counter() - start_time
+    queue.put((elapsed, rss_before, peak_rss_mb()))
+
+
+def run_benchmark(log_file, stages=STAGES, repeat=1):
+    """각 단계의 소요 시간, 처리량, 최대 RSS를 측정하여 결과 목록으로 반환한다."""
+    line_count = sum(1 for _ in analyzer.iter_log_lines(log_file))
+    size_mb = os.path.getsize(log_file) / (1024 * 1024)
+    context = multiprocessing.get_context('spawn')
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for stage in stages:
+            best = None
+            for _ in range(repeat):
+                queue = context.Queue()
+                process = context.Process(target=_run_stage, args=(stage, log_file, work_dir, queue))
+                process.start()
+                measured = queue.get()
+                process.join()
+                if best is None or measured[0] < best[0]:
+                    best = measured
+            elapsed, rss_before, rss_peak = best
+            results.append({
+                'stage': stage,
+                'seconds': round(elapsed, 4),
+                'lines_per_sec': round(line_count / elapsed) if elapsed else None,
+                'mb_per_sec': round(size_mb / elapsed, 2) if elapsed else None,
+                'peak_rss_mb': round(rss_peak, 1) if rss_peak is not None else None,
+                'stage_rss_mb': round(rss_peak - rss_before, 1) if rss_peak is not None else None,
+            })
+    return {'log_file': log_file, 'lines': line_count, 'size_mb': round(size_mb, 2), 'results': results}
+
+
+def print_results(report, previous=None):
+    """측정 결과를 표로 출력한다. previous가 있으면 이전 결과 대비 시간 비율도 출력한다."""
+    previous_seconds = {}
+    if previous:
+        previous_seconds = {result['stage']: result['seconds'] for result in previous['results']}
+    print(f"로그: {report['log_file']} ({report['lines']}줄, {report['size_mb']} MB)")
+    print(f"{'stage':<16}{'seconds':>10}{'lines/s':>14}{'MB/s':>10}{'peak RSS':>12}{'stage RSS':>12}{'vs prev':>10}")
+    for result in report['results']:
+        ratio = ''
+        if previous_seconds.get(result['stage']):
+            ratio = f"{result['seconds'] / previous_seconds[result['stage']]:.2f}x"
+        print(f"{result['stage']:<16}{result['seconds']:>10}{result['lines_per_sec'] or '-':>14}"
+              f"{result['mb_per_sec'] or '-':>10}{result['peak_rss_mb'] or '-':>12}"
+              f"{result['stage_rss_mb'] or '-':>12}{ratio:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미션 로그 분석기 벤치마크')
+    parser.add_argument('--log-file', help='측정에 사용할 로그 파일 (없으면 합성 로그를 생성한다)')
+    parser.add_argument('--lines', type=int, default=1000000, help='합성 로그의 줄 수')
+    parser.add_argument('--seed', type=int, default=2023, help='합성 로그의 난수 시드')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='측정할 단계')
+    parser.add_argument('--repeat', type=int, default=1, help='단계별 반복 횟수 (가장 빠른 결과를 사용)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = args.log_file
+        if log_file is None:
+            log_file = os.path.join(temp_dir, 'synthetic_mission.log')
+            print(f'합성 로그 {args.lines}줄 생성 중...')
+            generate_mission_log(log_file, args.lines, seed=args.seed)
+        report = run_benchmark(log_file, args.stages, args.repeat)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            previous = json.load(file)
+    print_results(report, previous)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import argparse
+import calendar
+import random
+import time
+
+
+# 이벤트 비율: 대부분 INFO이고 경고와 오류는 드물게 발생한다.
+EVENT_WEIGHTS = {
+    'INFO': 0.90,
+    'WARNING': 0.07,
+    'ERROR': 0.025,
+    'CRITICAL': 0.005,
+}
+
+MESSAGES = {
+    'INFO': [
+        'Power systems online. Batteries at optimal charge.',
+        'Communication established with mission control.',
+        'Avionics check: All systems functional.',
+        'Life support systems nominal.',
+        'Navigation systems show nominal performance.',
+        'Initial telemetry received. Rocket is on its trajectory.',
+        'Habitat pressure stable.',
+        'Solar array output within expected range.',
+        'Water recycling unit cycle complete.',
+        'Rover {id} docked and charging.',
+        'Sensor {id} heartbeat received.',
+    ],
+    'WARNING': [
+        'Battery temperature rising in module {id}.',
+        'Dust accumulation detected on solar array {id}.',
+        'Communication latency above threshold.',
+        'CO2 scrubber efficiency degraded.',
+    ],
+    'ERROR': [
+        'Sensor {id} not responding.',
+        'Pressure drop detected in airlock {id}.',
+        'Telemetry packet checksum mismatch.',
+    ],
+    'CRITICAL': [
+        'Oxygen tank unstable.',
+        'Hull breach alarm in module {id}.',
+    ],
+}
+
+# 사고 시나리오: 불안정 -> 폭발 -> 시스템 종료 순으로 연속해서 기록된다.
+INCIDENT = [
+    ('WARNING', 'Oxygen tank unstable.'),
+    ('CRITICAL', 'Oxygen tank explosion.'),
+    ('INFO', 'Center and mission control systems powered down.'),
+]
+
+
+def generate_mission_log(file_path, line_count, seed=None, incident_rate=0.0001,
+                         start='2023-08-27 10:00:00', max_step=3):
+    """mission_computer_main.log 형식의 합성 로그를 line_count줄 생성한다.
+
+    timestamp는 UTC 기준으로 0~max_step초씩 증가하고, incident_rate 확률로
+    사고 시나리오를 삽입한다. seed를 주면 같은 로그를 다시 만들 수 있다.
+    """
+    rng = random.Random(seed)
+    events = list(EVENT_WEIGHTS)
+    weights = list(EVENT_WEIGHTS.values())
+    epoch = calendar.timegm(time.strptime(start, '%Y-%m-%d %H:%M:%S'))
+    last_epoch = None
+    timestamp = ''
+    written = 0
+    batch = []
+
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write('timestamp,event,message\n')
+        while written < line_count:
+            if rng.random() < incident_rate:
+                records = INCIDENT
+            else:
+                event = rng.choices(events, weights)[0]
+                message = rng.choice(MESSAGES[event]).format(id=rng.randint(1, 64))
+                records = [(event, message)]
+
+            for event, message in records:
+                if written >= line_count:
+                    break
+                epoch += rng.randint(0, max_step)
+                # 같은 초가 반복되는 경우가 많으므로 문자열 변환은 초가 바뀔 때만 한다.
+                if epoch != last_epoch:
+                    timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(epoch))
+                    last_epoch = epoch
+                batch.append(f'{timestamp},{event},{message}\n')
+                written += 1
+
+            if len(batch) >= 10000:
+                file.writelines(batch)
+                batch = []
+        file.writelines(batch)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 미션 로그 생성기')
+    parser.add_argument('output', help='생성할 로그 파일 경로')
+    parser.add_argument('--lines', type=int, default=1000000, help='생성할 로그 줄 수')
+    parser.add_argument('--seed', type=int, default=None, help='난수 시드')
+    parser.add_argument('--incident-rate', type=float, default=0.0001, help='사고 시나리오 삽입 확률')
+    args = parser.parse_args()
+
+    start_time = time.time()
+    written = generate_mission_log(args.output, args.lines, args.seed, args.incident_rate)
+    print(f'{written}줄 생성 완료 ({time.time() - start_time:.1f}초): {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,190 @@
+import argparse
+import bisect
+import bz2
+import calendar
+import codecs
+import functools
+import gc
+import gzip
+import heapq
+import io
+import json
+import lzma
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from collections import deque
+from multiprocessing import Pool
+
+
+GZIP_MAGIC = b'\x1f\x8b\x08'
+COMPRESSION_MAGIC = {
+    'gzip': GZIP_MAGIC,
+    'bz2': b'BZh',
+    'xz': b'\xfd7zXZ\x00',
+}
+COMPRESSION_OPENERS = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+def detect_compression(file_path):
+    """파일 앞부분의 매직 바이트로 압축 형식(gzip, bz2, xz)을 판별한다. 압축이 아니면 None."""
+    with open(file_path, 'rb') as file:
+        head = file.read(6)
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+def open_log_file(file_path):
+    """로그 파일을 텍스트 모드로 연다. 압축된 파일은 자동으로 풀면서 읽는다."""
+    compression = detect_compression(file_path)
+    if compression is None:
+        return open(file_path, 'r', encoding='utf-8')
+    return COMPRESSION_OPENERS[compression](file_path, 'rt', encoding='utf-8')
+
+# 워커 하나가 gzip 멤버 하나를 풀어 한 번에 돌려줄 수 있는 최대 크기. 이보다 큰 멤버는 스트리밍으로 푼다.
+GZIP_MEMBER_LIMIT = 4 * 1024 * 1024
+
+def _decompress_gzip_member(task):
+    """프로세스 풀에서 실행된다. start 위치에서 시작하는 gzip 멤버 하나를 푼다.
+
+    (start, 멤버의 끝 오프셋, 풀린 데이터)를 반환하고, 올바른 멤버가 아니거나
+    풀린 크기가 limit를 넘으면 (start, None, None)을 반환한다.
+    """
+    file_path, start, limit = task
+    decompressor = zlib.decompressobj(wbits=31)
+    chunks = []
+    size = 0
+    consumed = 0
+    pending = b''
+    try:
+        with open(file_path, 'rb') as file:
+            file.seek(start)
+            while not decompressor.eof:
+                if not pending:
+                    pending = file.read(1024 * 1024)
+                    if not pending:
+                        return start, None, None
+                    consumed += len(pending)
+                chunk = decompressor.decompress(pending, limit - size + 1)
+                pending = decompressor.unconsumed_tail
+                size += len(chunk)
+                if size > limit:
+                    return start, None, None
+                chunks.append(chunk)
+    except zlib.error:
+        return start, None, None
+    return start, start + consumed - len(decompressor.unused_data), b''.join(chunks)
+
+def _stream_gzip_member(file_path, start, sizes):
+    """start에서 시작하는 gzip 멤버 하나를 1MB씩 풀면서 내보낸다.
+
+    멤버가 끝나면 sizes에 (끝 오프셋, 풀린 크기)를 추가한다.
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    consumed = 0
+    size = 0
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        while not decompressor.eof:
+            data = decompressor.unconsumed_tail
+            if not data:
+                data = file.read(1024 * 1024)
+                if not data:
+                    raise EOFError('Compressed file ended before the end-of-stream marker was reached')
+                consumed += len(data)
+            chunk = decompressor.decompress(data, 1024 * 1024)
+            size += len(chunk)
+            if chunk:
+                yield chunk
+    sizes.append((start + consumed - len(decompressor.unused_data), size))
+
+def _find_gzip_members(file_path, start=0):
+    """start 이후에서 gzip 멤버가 시작될 수 있는 오프셋(매직 바이트 위치)을 모두 찾는다."""
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            candidates = []
+            position = data.find(GZIP_MAGIC, start)
+            while position != -1:
+                candidates.append(position)
+                position = data.find(GZIP_MAGIC, position + 1)
+    return candidates
+
+def iter_gzip_parallel(file_path, workers=None, member_limit=GZIP_MEMBER_LIMIT):
+    """여러 멤버로 이루어진 gzip 파일을 프로세스 풀에서 병렬로 풀어 순서대로 반환한다.
+
+    첫 멤버는 순차적으로 풀면서 바로 내보내므로, 멤버가 하나뿐인 일반 gzip 파일은
+    gzip.open과 같이 일정한 메모리로 처리된다. 두 번째 멤버가 있고 첫 멤버가
+    member_limit보다 작을 때만 풀을 사용한다. 매직 바이트 위치를 후보로 삼아 각
+    후보에서 멤버 하나씩을 풀고, 멤버의 끝을 따라가며 실제 멤버만 이어 붙인다.
+    압축 데이터 안에 우연히 나온 매직 바이트는 CRC 검사에 실패하거나 건너뛰어진다.
+    워커는 member_limit보다 크게 풀리는 멤버를 돌려보내지 않고, 그런 멤버는 부모가
+    스트리밍으로 푼다. 후보는 워커 수의 두 배씩 묶어서 처리하므로 메모리에 올라가는
+    풀린 데이터는 최대 workers * 2 * member_limit이다.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(file_path)
+    sizes = []
+    yield from _stream_gzip_member(file_path, 0, sizes)
+    expected, first_size = sizes[-1]
+    if expected < size and first_size <= member_limit:
+        candidates = _find_gzip_members(file_path, expected)
+        group_size = workers * 2
+        with Pool(workers) as pool:
+            i = 0
+            while i < len(candidates):
+                tasks = [(file_path, start, member_limit) for start in candidates[i:i + group_size]]
+                i += group_size
+                for start, end, data in pool.map(_decompress_gzip_member, tasks):
+                    if start != expected:
+                        continue
+                    if end is None:
+                        # 너무 크거나 깨진 멤버는 순차적으로 푼다. 깨진 멤버는 여기서 오류가 난다.
+                        yield from _stream_gzip_member(file_path, expected, sizes)
+                        expected = sizes[-1][0]
+                        continue
+                    yield data
+                    expected = end
+                while i < len(candidates) and candidates[i] < expected:
+                    i += 1
+    if expected != size:
+        # 후보에서 멤버를 찾지 못한 나머지는 순차적으로 푼다.
+        with open(file_path, 'rb') as file:
+            file.seek(expected)
+            with gzip.GzipFile(fileobj=file) as gzip_file:
+                while data := gzip_file.read(1024 * 1024):
+                    yield data
+
+def _iter_text_lines(chunks):
+    """바이트 조각 스트림을 UTF-8로 디코딩하여 한 줄씩 반환한다. 큰 조각은 1MB씩 나누어 디코딩한다."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    rest = ''
+    for chunk in chunks:
+        view = memoryview(chunk)
+        for start in range(0, len(view), 1024 * 1024):
+            lines = (rest + decoder.decode(view[start:start + 1024 * 1024])).split('\n')
+            rest = lines.pop()
+            for line in lines:
+                yield line + '\n'
+    rest += decoder.decode(b'', final=True)
+    if rest:
+        yield rest
+
 def read_log_file(file_path):
     """로그 파일을 읽고 예외 처리를 수행한다."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
+        with open_log_file(file_path) as file:
             return file.readlines()
     except FileNotFoundError:
         print('Error: 로그 파일을 찾을 수 없습니다.')
@@ -10,6 +193,196 @@ def read_log_file(file_path):
         print(f'Error: {error}')
         return []
 
+def check_log_files(log_file):
+    """로그 파일(또는 목록)을 모두 열어 읽을 수 있는지 확인한다.
+
+    출력 파일을 건드리기 전에 호출하며, 읽을 수 없으면 오류를 한 번 출력하고
+    False를 반환한다.
+    """
+    for file_path in [log_file] if isinstance(log_file, str) else log_file:
+        try:
+            with open_log_file(file_path) as file:
+                file.read(1)
+        except FileNotFoundError:
+            print('Error: 로그 파일을 찾을 수 없습니다.')
+            return False
+        except Exception as error:
+            print(f'Error: {error}')
+            return False
+    return True
+
+def iter_log_lines(file_path, workers=0, strict=False):
+    """로그 파일을 한 줄씩 읽어 스트리밍으로 반환한다. 파일 전체를 메모리에 올리지 않는다.
+
+    압축된 파일은 풀면서 읽고, workers가 2 이상이면 gzip 멤버를 병렬로 푼다.
+    strict가 True이면 읽는 도중에 난 오류를 출력하지 않고 그대로 올려 보낸다.
+    """
+    try:
+        if workers > 1 and detect_compression(file_path) == 'gzip':
+            yield from _iter_text_lines(iter_gzip_parallel(file_path, workers))
+            return
+        with open_log_file(file_path) as file:
+            yield from file
+    except FileNotFoundError:
+        if strict:
+            raise
+        print('Error: 로그 파일을 찾을 수 없습니다.')
+    except Exception as error:
+        if strict:
+            raise
+        print(f'Error: {error}')
+
+def parse_log_line(line):
+    """로그 한 줄을 파싱한다. 형식이 맞지 않으면 None을 반환한다."""
+    parts = line.strip().split(',', 2)
+    if len(parts) != 3:
+        return None
+    return {'timestamp': parts[0], 'event': parts[1], 'message': parts[2]}
+
+def iter_parse_logs(log_lines):
+    """로그 줄 스트림을 파싱하여 딕셔너리를 하나씩 반환한다."""
+    for line in log_lines:
+        log = parse_log_line(line)
+        if log is not None:
+            yield log
+
+# LogEntry가 epoch를 문자열로 바꿀 때 같은 초의 문자열을 공유하기 위해 기억해 두는 최대 개수
+TIMESTAMP_TEXT_MEMO_SIZE = 65536
+_timestamp_texts = {}
+
+def _shared_timestamp_text(epoch):
+    """epoch 초를 문자열로 변환한다. 최근에 변환한 epoch는 같은 문자열 객체를 돌려준다.
+
+    사전이 TIMESTAMP_TEXT_MEMO_SIZE를 넘으면 비우므로, 분석 단계가 끝나면
+    문자열이 로그 수만큼 남아 있지 않는다.
+    """
+    text = _timestamp_texts.get(epoch)
+    if text is None:
+        if len(_timestamp_texts) >= TIMESTAMP_TEXT_MEMO_SIZE:
+            _timestamp_texts.clear()
+        minute, second = divmod(epoch, 60)
+        text = _timestamp_texts[epoch] = _minute_to_timestamp(minute) + _SECOND_TEXTS[second]
+    return text
+
+class LogEntry:
+    """parse_logs의 딕셔너리 대신 쓸 수 있는 가벼운 로그 레코드.
+
+    __slots__로 속성 딕셔너리를 없애고, 이벤트 문자열은 sys.intern으로 공유한다.
+    timestamp에는 epoch 초(int)를 넣어 둘 수도 있으며, 이때 log['timestamp']는
+    읽을 때마다 문자열로 변환한다. 변환한 문자열은 로그에 보관하지 않고 크기가
+    제한된 공용 사전(_shared_timestamp_text)에서 같은 초끼리 공유한다.
+    log['message']처럼 딕셔너리와 같은 방식으로 읽을 수 있으므로 기존 분석 함수에
+    그대로 넘길 수 있다.
+    """
+
+    __slots__ = ('_timestamp', 'event', 'message')
+    _fields = ('timestamp', 'event', 'message')
+
+    def __init__(self, timestamp, event, message):
+        self._timestamp = timestamp
+        self.event = sys.intern(event)
+        self.message = message
+
+    @property
+    def timestamp(self):
+        if self._timestamp.__class__ is int:
+            return _shared_timestamp_text(self._timestamp)
+        return self._timestamp
+
+    @property
+    def epoch(self):
+        """epoch 초를 반환한다. 변환할 수 없는 timestamp이면 None."""
+        if isinstance(self._timestamp, int):
+            return self._timestamp
+        return timestamp_to_epoch(self._timestamp)
+
+    def __getitem__(self, key):
+        # 분석 함수가 로그마다 여러 번 부르므로 getattr 대신 키를 직접 비교한다.
+        if key == 'message':
+            return self.message
+        if key == 'event':
+            return self.event
+        if key == 'timestamp':
+            timestamp = self._timestamp
+            if timestamp.__class__ is not int:
+                return timestamp
+            text = _timestamp_texts.get(timestamp)
+            return text if text is not None else _shared_timestamp_text(timestamp)
+        raise KeyError(key)
+
+    def to_dict(self):
+        return {'timestamp': self.timestamp, 'event': self.event, 'message': self.message}
+
+    def __repr__(self):
+        return f'LogEntry({self.timestamp!r}, {self.event!r}, {self.message!r})'
+
+# parse_logs_compact가 메시지 문자열을 공유하기 위해 기억해 두는 최대 개수
+COMPACT_MESSAGE_MEMO_SIZE = 65536
+
+def parse_logs_compact(log_lines, parse_timestamps=False):
+    """parse_logs와 같은 로그를 LogEntry 목록으로 반환한다.
+
+    parse_timestamps가 True이면 timestamp를 epoch 초로 미리 변환해 저장한다.
+    정확히 되돌릴 수 없는 값(헤더 등)은 문자열 그대로 둔다. 같은 timestamp가
+    이어지면 앞 로그의 값을 그대로 쓰고, 반복되는 메시지는 하나의 문자열을 공유한다.
+    메시지 사전은 COMPACT_MESSAGE_MEMO_SIZE를 넘으면 비운다.
+    """
+    entries = []
+    append = entries.append
+    # LogEntry는 순환 참조를 만들지 않지만 GC 추적 대상이라, 대량으로 만들 때는
+    # 세대별 GC가 반복해서 전체 목록을 훑는다. 파싱하는 동안만 GC를 멈춘다.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        messages = {}
+        shared_message = messages.setdefault
+        previous = previous_value = None
+        for line in log_lines:
+            parts = line.strip().split(',', 2)
+            if len(parts) != 3:
+                continue
+            timestamp, event, message = parts
+            if timestamp == previous:
+                timestamp = previous_value
+            else:
+                previous = timestamp
+                if parse_timestamps:
+                    epoch = timestamp_to_epoch(timestamp)
+                    if epoch is not None:
+                        timestamp = epoch
+                previous_value = timestamp
+            if len(messages) >= COMPACT_MESSAGE_MEMO_SIZE:
+                messages.clear()
+            append(LogEntry(timestamp, event, shared_message(message, message)))
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return entries
+
+def iter_merged_logs(log_files, workers=0, with_source=False, strict=False):
+    """여러 로그 파일을 timestamp 순서대로 하나의 스트림으로 병합한다.
+
+    각 파일은 시간순으로 기록되어 있다고 보고, 힙 기반 k-way 병합으로 파일마다
+    한 줄씩만 읽어 가며 합친다. 시각이 같으면 앞쪽 파일의 로그가 먼저 나온다.
+    헤더처럼 시각이 아닌 줄은 순서를 깨뜨리므로 제외한다.
+    with_source가 True이면 각 로그에 원본 파일 경로('source')를 추가한다.
+    strict는 iter_log_lines에 그대로 넘긴다.
+    """
+    def iter_file(log_file):
+        for log in iter_parse_logs(iter_log_lines(log_file, workers, strict)):
+            if log['timestamp'][:1].isdigit():
+                if with_source:
+                    log['source'] = log_file
+                yield log
+
+    return heapq.merge(*(iter_file(log_file) for log_file in log_files), key=lambda log: log['timestamp'])
+
+def iter_log_entries(log_file, workers=0, strict=False):
+    """로그 파일 하나 또는 여러 파일(목록)의 로그를 스트리밍으로 반환한다."""
+    if isinstance(log_file, str):
+        return iter_parse_logs(iter_log_lines(log_file, workers, strict))
+    return iter_merged_logs(log_file, workers, strict=strict)
+
 def parse_logs(log_lines):
     """로그 데이터를 파싱하여 리스트 형태로 반환한다."""
     return [
@@ -18,71 +391,1261 @@ def parse_logs(log_lines):
         if (parts := line.strip().split(',', 2)) and len(parts) == 3
     ]
 
+def split_file_ranges(file_path, count):
+    """파일을 count개의 바이트 구간으로 나눈다. 각 구간의 경계는 줄바꿈에 맞춘다."""
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, 'rb') as file:
+        for i in range(1, count):
+            position = size * i // count
+            if position <= boundaries[-1]:
+                continue
+            file.seek(position - 1)
+            file.readline()  # 구간 중간에서 끊긴 줄은 다음 줄 시작까지 넘긴다.
+            position = file.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+def _read_range(file_path, start, end):
+    """파일의 한 구간을 읽어 줄 단위로 읽을 수 있는 텍스트 스트림으로 반환한다."""
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        chunk = file.read(end - start).decode('utf-8')
+    return io.StringIO(chunk, newline=None)
+
+def _parse_range(task):
+    """프로세스 풀에서 실행된다. 파일의 한 구간을 읽어 파싱한다."""
+    file_path, start, end = task
+    return parse_logs(_read_range(file_path, start, end))
+
+def parallel_parse_logs(file_path, workers=None, chunks_per_worker=4):
+    """로그 파일을 줄 단위로 정렬된 구간으로 나누어 여러 프로세스에서 파싱한다.
+
+    구간을 워커 수보다 잘게 나누어 작업량을 고르게 분배하고,
+    결과는 파일 순서대로 이어 붙인다. 파싱한 딕셔너리를 부모 프로세스에서 다시
+    만드는 비용이 파싱 자체와 비슷하므로, 전체 분석에는 워커 안에서 정렬과 집계까지
+    끝내는 parallel_analyze_logs를 사용한다.
+    """
+    workers = workers or os.cpu_count() or 1
+    try:
+        if detect_compression(file_path):
+            # 압축 파일은 바이트 구간으로 나눌 수 없으므로 병렬로 풀면서 파싱한다.
+            return parse_logs(iter_log_lines(file_path, workers))
+        ranges = split_file_ranges(file_path, workers * chunks_per_worker)
+    except FileNotFoundError:
+        print('Error: 로그 파일을 찾을 수 없습니다.')
+        return []
+    tasks = [(file_path, start, end) for start, end in ranges]
+    log_entries = []
+    with Pool(workers) as pool:
+        for entries in pool.imap(_parse_range, tasks):
+            log_entries.extend(entries)
+    return log_entries
+
 def save_logs(log_entries, output_file, sort=False, reverse=False):
     """로그를 저장한다. 정렬 옵션을 포함한다."""
     if sort:
-        log_entries = sorted(log_entries, key=lambda x: x['timestamp'], reverse=reverse)
+        # 정렬 키로 읽은 timestamp를 저장할 때 다시 쓴다. LogEntry는 읽을 때마다 변환하므로
+        # 한 번만 읽는 편이 빠르다.
+        log_entries = list(log_entries)
+        timestamps = [log['timestamp'] for log in log_entries]
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__, reverse=reverse)
+        with open(output_file, 'w', encoding='utf-8') as file:
+            for i in order:
+                log = log_entries[i]
+                file.write(f"{timestamps[i]}, {log['event']}, {log['message']}\n")
+        return
     with open(output_file, 'w', encoding='utf-8') as file:
         for log in log_entries:
             file.write(f"{log['timestamp']}, {log['event']}, {log['message']}\n")
 
-def extract_logs(log_entries, keyword, context=1):
-    """특정 키워드(폭발)와 관련된 로그를 추출한다."""
-    indices = [i for i, log in enumerate(log_entries) if keyword in log['message'].lower()]
+def _line_timestamp(line):
+    """save_logs 형식의 한 줄에서 정렬 키(timestamp)를 꺼낸다."""
+    return line.split(',', 1)[0]
+
+# 정렬할 때 줄마다 추가로 생기는 메모리: 정렬 키 문자열과 두 리스트(줄, 키)의 포인터
+_RUN_LINE_OVERHEAD = sys.getsizeof('0000-00-00 00:00:00') + 16
+
+def _write_sorted_run(lines, reverse, directory):
+    """정렬된 구간(run)을 directory 안의 임시 파일에 기록하고 경로를 반환한다."""
+    lines.sort(key=_line_timestamp, reverse=reverse)
+    handle, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    with open(handle, 'w', encoding='utf-8') as run:
+        run.writelines(lines)
+    return path
+
+def _merge_run_files(run_paths, output, reverse):
+    """run 파일들을 모두 열어 heapq.merge로 병합한 결과를 output에 쓴다."""
+    runs = []
+    try:
+        for path in run_paths:
+            runs.append(open(path, 'r', encoding='utf-8'))
+        output.writelines(heapq.merge(*runs, key=_line_timestamp, reverse=reverse))
+    finally:
+        for run in runs:
+            run.close()
+
+def merge_sorted_runs(run_paths, output_file, reverse=False, fan_in=64):
+    """정렬된 run 파일들을 output_file 하나로 병합한다.
+
+    한 번에 여는 파일은 fan_in개 이하로 제한한다. run이 그보다 많으면 앞에서부터
+    fan_in개씩 묶어 중간 run으로 합치는 과정을 반복한다. 이웃한 run끼리 순서대로
+    합치므로 시각이 같은 줄의 순서(안정성)가 유지된다. 병합한 run 파일은 지운다.
+    """
+    run_paths = list(run_paths)
+    while len(run_paths) > fan_in:
+        merged_paths = []
+        for i in range(0, len(run_paths), fan_in):
+            group = run_paths[i:i + fan_in]
+            if len(group) == 1:
+                merged_paths.append(group[0])
+                continue
+            handle, path = tempfile.mkstemp(suffix='.run', dir=os.path.dirname(group[0]))
+            with open(handle, 'w', encoding='utf-8') as output:
+                _merge_run_files(group, output, reverse)
+            for run_path in group:
+                os.remove(run_path)
+            merged_paths.append(path)
+        run_paths = merged_paths
+    with open(output_file, 'w', encoding='utf-8') as output:
+        _merge_run_files(run_paths, output, reverse)
+
+def _write_sampled_run(lines, reverse, directory, every=256):
+    """_write_sorted_run과 같이 run 파일을 쓰고, every줄마다 (정렬 키, 바이트 오프셋) 표본을 함께 반환한다.
+
+    parallel_merge_runs가 이 표본으로 run을 정렬 키 구간별로 나눈다. 키는 UTF-8 바이트로 둔다.
+    """
+    lines.sort(key=_line_timestamp, reverse=reverse)
+    handle, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    samples = []
+    offset = 0
+    with open(handle, 'wb') as run:
+        for i in range(0, len(lines), every):
+            block = ''.join(lines[i:i + every]).encode('utf-8')
+            samples.append((_line_timestamp(lines[i]).encode('utf-8'), offset))
+            run.write(block)
+            offset += len(block)
+    return path, samples
+
+def _run_key(line):
+    """run 파일에서 바이트로 읽은 한 줄의 정렬 키"""
+    return line.split(b',', 1)[0]
+
+def _precedes(key, bound, reverse):
+    """출력 순서에서 key가 bound보다 앞에 오는지 확인한다."""
+    return key > bound if reverse else key < bound
+
+def _iter_run_slice(path, offset, start_key, stop_key, reverse):
+    """run 파일의 offset부터 읽어 출력 순서로 start_key부터(같은 키 포함) stop_key 전까지의 줄을 반환한다.
+
+    None인 경계는 제한이 없다는 뜻이다.
+    """
+    with open(path, 'rb') as run:
+        run.seek(offset)
+        for line in run:
+            if start_key is not None and _precedes(_run_key(line), start_key, reverse):
+                continue
+            if stop_key is not None and not _precedes(_run_key(line), stop_key, reverse):
+                return
+            yield line
+            break
+        for line in run:
+            if stop_key is not None and not _precedes(_run_key(line), stop_key, reverse):
+                return
+            yield line
+
+def _merge_run_range(task):
+    """프로세스 풀에서 실행된다. 모든 run에서 한 정렬 키 구간만 읽어 병합한 조각 파일을 쓴다."""
+    slices, start_key, stop_key, reverse, piece_path = task
+    runs = [_iter_run_slice(path, offset, start_key, stop_key, reverse) for path, offset in slices]
+    with open(piece_path, 'wb') as piece:
+        piece.writelines(heapq.merge(*runs, key=_run_key, reverse=reverse))
+    return piece_path
+
+def parallel_merge_runs(pool, runs, output_file, reverse=False, partitions=4):
+    """_write_sampled_run으로 만든 (run 경로, 표본) 목록을 풀에서 나누어 병합한다.
+
+    표본 키로 정렬 키 공간을 partitions개 구간으로 나누면 구간마다 각 run의 연속된
+    일부만 병합하면 된다. 같은 키는 한 구간에만 들어가고 구간 안에서는 run 순서대로
+    병합하므로 merge_sorted_runs와 결과가 같다. 부모 프로세스는 구간별 조각 파일을
+    순서대로 이어 붙이기만 한다.
+    """
+    keys = sorted({key for _, samples in runs for key, _ in samples}, reverse=reverse)
+    splitters = sorted({keys[len(keys) * i // partitions] for i in range(1, partitions)} if keys else (),
+                       reverse=reverse)
+    bounds = [None] + splitters + [None]
+    directory = os.path.dirname(runs[0][0]) if runs else None
+    tasks = []
+    for start_key, stop_key in zip(bounds[:-1], bounds[1:]):
+        slices = []
+        for path, samples in runs:
+            # start_key보다 앞에 오는 마지막 표본부터 읽으면 된다.
+            offset = 0
+            if start_key is not None:
+                for key, sample_offset in samples:
+                    if not _precedes(key, start_key, reverse):
+                        break
+                    offset = sample_offset
+            slices.append((path, offset))
+        handle, piece_path = tempfile.mkstemp(suffix='.piece', dir=directory)
+        os.close(handle)
+        tasks.append((slices, start_key, stop_key, reverse, piece_path))
+
+    with open(output_file, 'w', encoding='utf-8') as output:
+        for piece_path in pool.imap(_merge_run_range, tasks):
+            with open(piece_path, 'r', encoding='utf-8', newline='') as piece:
+                shutil.copyfileobj(piece, output)
+            os.remove(piece_path)
+
+def external_sort_logs(log_entries, output_file, reverse=False, memory_limit=64 * 1024 * 1024, fan_in=64):
+    """메모리보다 큰 로그를 외부 병합 정렬로 저장한다.
+
+    로그를 memory_limit 바이트 이하의 구간으로 나누어 각각 정렬한 뒤 임시 파일에
+    기록하고, merge_sorted_runs로 fan_in개씩 k-way 병합한다. 메모리 사용량은 문자열
+    객체의 실제 크기(sys.getsizeof)와 정렬 키로 계산한다. 정렬이 안정적이므로
+    save_logs(..., sort=True)와 같은 결과를 만든다.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        runs = []
+        lines = []
+        size = 0
+        for log in log_entries:
+            line = f"{log['timestamp']}, {log['event']}, {log['message']}\n"
+            lines.append(line)
+            size += sys.getsizeof(line) + _RUN_LINE_OVERHEAD
+            if size >= memory_limit:
+                runs.append(_write_sorted_run(lines, reverse, directory))
+                lines = []
+                size = 0
+        if lines or not runs:
+            runs.append(_write_sorted_run(lines, reverse, directory))
+        lines = []
+        merge_sorted_runs(runs, output_file, reverse, fan_in)
+
+class KeywordMatcher:
+    """여러 키워드를 한 번에 찾는 Aho-Corasick 오토마톤.
+
+    키워드가 수백 개여도 메시지를 한 번만 훑어서 포함된 키워드를 모두 찾는다.
+    키워드가 적을 때는 문자열 검색(in)을 키워드마다 하는 쪽이 빠르므로 그 방식을 쓴다.
+    """
+
+    # 이 개수 이하에서는 파이썬으로 문자를 하나씩 따라가는 오토마톤보다 in 검색이 빠르다.
+    DIRECT_SEARCH_LIMIT = 48
+
+    def __init__(self, keywords, ignore_case=True):
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        self.keywords = list(dict.fromkeys(keywords))
+        self.ignore_case = ignore_case
+        self._patterns = [
+            (keyword.lower() if ignore_case else keyword, keyword)
+            for keyword in self.keywords
+        ]
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        # 1. 키워드로 트라이를 만든다.
+        for keyword in self.keywords:
+            state = 0
+            for char in (keyword.lower() if ignore_case else keyword):
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state] += (keyword,)
+
+        # 2. 너비 우선으로 실패 링크를 계산하고 출력 집합을 물려받는다.
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._output[state] += self._output[0]
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, text):
+        """text에 포함된 키워드의 집합을 반환한다."""
+        if self.ignore_case:
+            text = text.lower()
+        if len(self._patterns) <= self.DIRECT_SEARCH_LIMIT:
+            return {keyword for pattern, keyword in self._patterns if pattern in text}
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        hits = set(output[0])
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+        return hits
+
+def _as_matcher(keywords):
+    """키워드(문자열 또는 목록)를 KeywordMatcher로 변환한다."""
+    if isinstance(keywords, KeywordMatcher):
+        return keywords
+    return KeywordMatcher(keywords)
+
+def find_keyword_matches(log_entries, keywords):
+    """키워드가 포함된 로그의 (인덱스, 찾은 키워드 집합) 목록을 한 번의 패스로 구한다."""
+    matcher = _as_matcher(keywords)
+    return [
+        (i, hits)
+        for i, log in enumerate(log_entries)
+        if (hits := matcher.find(log['message']))
+    ]
+
+def iter_extract_logs(log_entries, keyword, context=1, on_match=None):
+    """extract_logs와 같은 결과를 스트리밍으로 반환한다.
+
+    최근 2 * context + 1개의 로그만 보관하고, 키워드가 나온 로그 뒤로
+    context개의 로그가 더 들어오면 그 구간을 내보낸다.
+    on_match가 주어지면 키워드가 포함된 로그마다 on_match(log, hits)를 호출한다.
+    """
+    matcher = _as_matcher(keyword)
+    history = deque(maxlen=2 * context + 1)
+    pending = deque()
+    index = -1
+    for index, log in enumerate(log_entries):
+        history.append((index, log))
+        hits = matcher.find(log['message'])
+        if hits:
+            pending.append(index)
+            if on_match is not None:
+                on_match(log, hits)
+        while pending and pending[0] + context <= index:
+            match = pending.popleft()
+            for i, entry in history:
+                if match - context <= i <= match + context:
+                    yield entry
+    # 파일 끝에 가까운 키워드는 뒤쪽 문맥이 잘린 채로 내보낸다.
+    while pending:
+        match = pending.popleft()
+        for i, entry in history:
+            if match - context <= i <= min(index, match + context):
+                yield entry
+
+def iter_context_logs(log_entries, keyword, before=1, after=1, on_match=None):
+    """grep -B/-A처럼 키워드 앞뒤 로그를 한 번의 패스로 추출한다.
+
+    앞쪽 문맥은 크기가 before인 링 버퍼에 보관하고, 뒤쪽 문맥은 남은 줄 수를
+    세어 내보낸다. 겹치는 구간은 합쳐지므로 같은 로그가 두 번 나오지 않으며,
+    메모리는 before 크기만큼만 사용한다.
+    on_match가 주어지면 키워드가 포함된 로그마다 on_match(log, hits)를 호출한다.
+    """
+    matcher = _as_matcher(keyword)
+    ring = deque(maxlen=before) if before > 0 else None
+    remaining = 0
+    for log in log_entries:
+        hits = matcher.find(log['message'])
+        if hits:
+            if on_match is not None:
+                on_match(log, hits)
+            if ring:
+                yield from ring
+                ring.clear()
+            yield log
+            remaining = after
+        elif remaining > 0:
+            yield log
+            remaining -= 1
+        elif ring is not None:
+            ring.append(log)
+
+def extract_logs(log_entries, keyword, context=1, matches=None):
+    """특정 키워드(폭발)와 관련된 로그를 추출한다.
+
+    keyword에는 여러 키워드의 목록도 줄 수 있다. find_keyword_matches의
+    결과를 matches로 넘기면 로그를 다시 훑지 않는다.
+    """
+    if matches is None:
+        matches = find_keyword_matches(log_entries, keyword)
     return [
         log_entries[i]
-        for index in indices
+        for index, _ in matches
         for i in range(max(0, index - context), min(len(log_entries), index + context + 1))
     ]
 
-def generate_report(log_entries, report_file):
-    """사고 원인 분석 결과를 Markdown 파일로 저장한다."""
-    with open(report_file, 'w', encoding='utf-8') as file:
-        file.write('# 사고 분석 보고서\n\n')
-        file.write('## 1. 사고 개요\n')
-        file.write('화성 기지 폭발 사고의 원인을 분석한다.\n\n')
+def build_time_index(log_file, index_file=None, every=1000):
+    """timestamp -> 바이트 오프셋 색인을 만들어 사이드카 파일(.idx)로 저장한다.
+
+    every줄마다 한 번씩 (timestamp, 오프셋)을 기록한다. 로그가 시간순으로
+    정렬되어 있지 않으면 sorted를 False로 기록해 두고, 조회 시 전체를 스캔한다.
+    """
+    index_file = index_file or log_file + '.idx'
+    samples = []
+    is_sorted = True
+    last_timestamp = None
+    with open(log_file, 'rb') as file:
+        offset = 0
+        count = 0
+        for raw_line in file:
+            log = parse_log_line(raw_line.decode('utf-8'))
+            if log is not None and log['timestamp'][:1].isdigit():
+                timestamp = log['timestamp']
+                if last_timestamp is not None and timestamp < last_timestamp:
+                    is_sorted = False
+                last_timestamp = timestamp
+                if count % every == 0:
+                    samples.append([timestamp, offset])
+                count += 1
+            offset += len(raw_line)
+    stat = os.stat(log_file)
+    index = {
+        'source_size': stat.st_size,
+        'source_mtime': stat.st_mtime,
+        'every': every,
+        'sorted': is_sorted,
+        'samples': samples,
+    }
+    with open(index_file, 'w', encoding='utf-8') as file:
+        json.dump(index, file)
+    return index
+
+def load_time_index(log_file, index_file=None, every=1000):
+    """색인 파일을 읽는다. 없거나 로그 파일이 바뀌었으면 새로 만든다."""
+    index_file = index_file or log_file + '.idx'
+    stat = os.stat(log_file)
+    try:
+        with open(index_file, 'r', encoding='utf-8') as file:
+            index = json.load(file)
+        if index['source_size'] == stat.st_size and index['source_mtime'] == stat.st_mtime:
+            return index
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    return build_time_index(log_file, index_file, every)
+
+def query_time_range(log_file, start, end, index=None):
+    """start <= timestamp <= end 인 로그를 반환한다.
+
+    색인에서 이진 탐색으로 start 직전 표본의 오프셋을 찾아 그 위치부터 읽고,
+    end를 넘는 로그가 나오면 바로 멈춘다.
+    """
+    index = index or load_time_index(log_file)
+    offset = 0
+    if index['sorted']:
+        timestamps = [timestamp for timestamp, _ in index['samples']]
+        position = bisect.bisect_left(timestamps, start) - 1
+        if position >= 0:
+            offset = index['samples'][position][1]
+    with open(log_file, 'rb') as file:
+        file.seek(offset)
+        for raw_line in file:
+            log = parse_log_line(raw_line.decode('utf-8'))
+            if log is None or not log['timestamp'][:1].isdigit():
+                continue
+            if log['timestamp'] > end:
+                if index['sorted']:
+                    break
+                continue
+            if log['timestamp'] >= start:
+                yield log
+
+def load_checkpoint(checkpoint_file):
+    """팔로우 모드의 체크포인트(inode, 오프셋)를 읽는다. 없으면 None을 반환한다."""
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as file:
+            checkpoint = json.load(file)
+        return {'inode': checkpoint['inode'], 'offset': checkpoint['offset']}
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return None
 
-        file.write('## 2. 로그 분석\n')
-        file.write('| Timestamp | Event | Message |\n')
-        file.write('|-----------|-------|---------|\n')
+def save_checkpoint(checkpoint_file, inode, offset):
+    """체크포인트를 임시 파일에 쓴 뒤 교체하여, 중간에 종료되어도 깨지지 않게 한다."""
+    temp_file = checkpoint_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as file:
+        json.dump({'inode': inode, 'offset': offset}, file)
+    os.replace(temp_file, checkpoint_file)
 
+def follow_logs(log_file, checkpoint_file=None, poll_interval=1.0, idle_timeout=None, batch_size=10000):
+    """tail -F처럼 늘어나는 로그 파일에서 새로 추가된 로그만 반환한다.
+
+    처리한 위치(inode, 바이트 오프셋)를 체크포인트 파일에 저장하므로, 다시
+    실행하면 멈춘 곳부터 이어서 읽는다. 아직 줄바꿈이 없는 마지막 줄은 완성될
+    때까지 기다린다. 파일이 교체(로그 회전)되면 기존 파일을 끝까지 읽은 뒤 새
+    파일의 처음부터, 파일이 잘리면(truncate) 처음부터 다시 읽는다.
+    idle_timeout초 동안 새 로그가 없으면 종료한다. None이면 계속 기다린다.
+    """
+    checkpoint_file = checkpoint_file or log_file + '.ckpt'
+    checkpoint = load_checkpoint(checkpoint_file)
+    file = None
+    inode = None
+    offset = 0
+    idle = 0.0
+    try:
+        while True:
+            if file is None:
+                try:
+                    file = open(log_file, 'rb')
+                except FileNotFoundError:
+                    file = None
+                if file is not None:
+                    stat = os.fstat(file.fileno())
+                    inode = stat.st_ino
+                    offset = 0
+                    if checkpoint and checkpoint['inode'] == inode and checkpoint['offset'] <= stat.st_size:
+                        offset = checkpoint['offset']
+                    checkpoint = None
+                    file.seek(offset)
+
+            lines = []
+            while file is not None and len(lines) < batch_size:
+                line = file.readline()
+                if not line.endswith(b'\n'):
+                    file.seek(offset)  # 완성되지 않은 줄은 다음에 다시 읽는다.
+                    break
+                lines.append(line)
+                offset += len(line)
+
+            if lines:
+                idle = 0.0
+                for log in iter_parse_logs(line.decode('utf-8') for line in lines):
+                    yield log
+                save_checkpoint(checkpoint_file, inode, offset)
+                continue
+
+            # 새 로그가 없으면 로그 회전이나 잘림을 확인한다.
+            try:
+                stat = os.stat(log_file)
+            except FileNotFoundError:
+                stat = None
+            if file is not None and stat is not None:
+                if stat.st_ino != inode:
+                    file.close()
+                    file = None
+                    continue
+                if stat.st_size < offset:
+                    offset = 0
+                    file.seek(0)
+                    save_checkpoint(checkpoint_file, inode, offset)
+                    continue
+
+            if idle_timeout is not None and idle >= idle_timeout:
+                return
+            time.sleep(poll_interval)
+            idle += poll_interval
+    finally:
+        if file is not None:
+            file.close()
+
+CACHE_MAGIC = b'MLOGCOL1'
+# magic, 바이트 순서, 로그 수, 원본 크기, 원본 수정 시각, 각 구간의 오프셋과 길이
+CACHE_HEADER = struct.Struct('<8sc7xQQdQQQQQQQ')
+
+@functools.lru_cache(maxsize=4096)
+def _date_to_epoch(date):
+    """'YYYY-MM-DD' 문자열을 그날 0시의 epoch 초로 변환한다. 올바른 날짜가 아니면 None."""
+    digits = date[:4] + date[5:7] + date[8:]
+    if len(date) != 10 or date[4] != '-' or date[7] != '-' or not (digits.isascii() and digits.isdigit()):
+        return None
+    year, month, day = int(date[:4]), int(date[5:7]), int(date[8:])
+    if year < 1000 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return calendar.timegm((year, month, day, 0, 0, 0))
+
+# '00'~'59' 문자열과 초. 숫자 검사와 int 변환을 한 번의 사전 조회로 대신한다.
+_SECONDS = {'%02d' % second: second for second in range(60)}
+_SECOND_TEXTS = list(_SECONDS)
+
+@functools.lru_cache(maxsize=4096)
+def _minute_to_epoch(minute):
+    """'YYYY-MM-DD HH:MM' 문자열을 epoch 초로 변환한다. 올바른 시각이 아니면 None."""
+    clock = minute[11:13] + minute[14:]
+    if minute[10] != ' ' or minute[13] != ':' or not clock.isdigit() or not clock.isascii():
+        return None
+    date = _date_to_epoch(minute[:10])
+    hour, minute = int(clock[:2]), int(clock[2:])
+    if date is None or hour > 23 or minute > 59:
+        return None
+    return date + hour * 3600 + minute * 60
+
+def timestamp_to_epoch(timestamp):
+    """'YYYY-MM-DD HH:MM:SS' 문자열을 epoch 초로 변환한다. 정확히 되돌릴 수 없으면 None.
+
+    strptime 대신 고정 위치를 잘라 정수로 바꾼다. 분 단위까지는 캐시하므로
+    같은 분에 찍힌 로그는 초만 더하면 된다.
+    """
+    if len(timestamp) != 19 or timestamp[16] != ':':
+        return None
+    base = _minute_to_epoch(timestamp[:16])
+    second = _SECONDS.get(timestamp[17:])
+    if base is None or second is None:
+        return None
+    return base + second
+
+@functools.lru_cache(maxsize=4096)
+def _minute_to_timestamp(minute):
+    """1970-01-01부터 센 분 수를 'YYYY-MM-DD HH:MM:' 문자열로 변환한다."""
+    return time.strftime('%Y-%m-%d %H:%M:', time.gmtime(minute * 60))
+
+def epoch_to_timestamp(epoch):
+    """epoch 초를 'YYYY-MM-DD HH:MM:SS' 문자열로 변환한다. 분 단위까지는 캐시한다."""
+    minute, second = divmod(int(epoch), 60)
+    return _minute_to_timestamp(minute) + _SECOND_TEXTS[second]
+
+def _pad8(file):
+    """다음 구간이 8바이트 경계에서 시작하도록 0으로 채운다."""
+    file.write(b'\0' * (-file.tell() % 8))
+
+def build_log_cache(log_file, cache_file=None):
+    """로그를 한 번 파싱하여 열(column) 단위 바이너리 캐시로 저장한다.
+
+    - timestamp: int64 epoch 배열 (형식이 다른 값은 원문을 메타데이터에 보관)
+    - event: 문자열 사전 + uint32 코드 배열
+    - message: int64 오프셋 배열 + UTF-8 바이트 덩어리
+    """
+    cache_file = cache_file or log_file + '.colcache'
+    timestamps = array('q')
+    codes = array('I')
+    offsets = array('q', [0])
+    events = {}
+    raw_timestamps = {}
+    with tempfile.TemporaryFile() as blob:
+        previous_timestamp = previous_epoch = None
+        for i, log in enumerate(iter_parse_logs(iter_log_lines(log_file))):
+            # 같은 초에 찍힌 로그가 이어지는 경우가 많으므로 바로 앞 줄의 결과를 재사용한다.
+            if log['timestamp'] == previous_timestamp:
+                epoch = previous_epoch
+            else:
+                previous_timestamp = log['timestamp']
+                epoch = previous_epoch = timestamp_to_epoch(previous_timestamp)
+            if epoch is None:
+                raw_timestamps[i] = log['timestamp']
+                epoch = 0
+            timestamps.append(epoch)
+            codes.append(events.setdefault(log['event'], len(events)))
+            offsets.append(offsets[-1] + blob.write(log['message'].encode('utf-8')))
+        meta = json.dumps({'events': list(events), 'raw_timestamps': raw_timestamps}).encode('utf-8')
+
+        stat = os.stat(log_file)
+        with open(cache_file, 'wb') as file:
+            file.write(b'\0' * CACHE_HEADER.size)
+            timestamps_offset = file.tell()
+            timestamps.tofile(file)
+            _pad8(file)
+            codes_offset = file.tell()
+            codes.tofile(file)
+            _pad8(file)
+            offsets_offset = file.tell()
+            offsets.tofile(file)
+            meta_offset = file.tell()
+            file.write(meta)
+            _pad8(file)
+            blob_offset = file.tell()
+            blob.seek(0)
+            shutil.copyfileobj(blob, file)
+            file.seek(0)
+            file.write(CACHE_HEADER.pack(
+                CACHE_MAGIC, b'<' if sys.byteorder == 'little' else b'>', len(timestamps),
+                stat.st_size, stat.st_mtime, timestamps_offset, codes_offset, offsets_offset,
+                meta_offset, len(meta), blob_offset, offsets[-1],
+            ))
+    return cache_file
+
+class LogColumns:
+    """메모리 매핑한 열 단위 로그 캐시.
+
+    파일을 읽어 들이지 않고 필요한 로그만 꺼내 쓰므로 바로 열리고 메모리를 적게
+    사용한다. log_entries[i]나 반복문으로 기존 분석 함수에 그대로 넘길 수 있다.
+    """
+
+    def __init__(self, cache_file):
+        self._file = open(cache_file, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        (magic, byteorder, count, self.source_size, self.source_mtime, timestamps_offset,
+         codes_offset, offsets_offset, meta_offset, meta_length, blob_offset, blob_length) = \
+            CACHE_HEADER.unpack_from(self._map)
+        if magic != CACHE_MAGIC or byteorder != (b'<' if sys.byteorder == 'little' else b'>'):
+            view.release()
+            self.close()
+            raise ValueError('지원하지 않는 캐시 파일입니다.')
+        self._count = count
+        self.timestamps = view[timestamps_offset:timestamps_offset + count * 8].cast('q')
+        self.event_codes = view[codes_offset:codes_offset + count * 4].cast('I')
+        self._offsets = view[offsets_offset:offsets_offset + (count + 1) * 8].cast('q')
+        self._blob = view[blob_offset:blob_offset + blob_length]
+        meta = json.loads(bytes(view[meta_offset:meta_offset + meta_length]))
+        self.events = meta['events']
+        self._raw_timestamps = {int(i): value for i, value in meta['raw_timestamps'].items()}
+        self._views = [view, self.timestamps, self.event_codes, self._offsets, self._blob]
+
+    def __len__(self):
+        return self._count
+
+    def timestamp(self, i):
+        raw = self._raw_timestamps.get(i)
+        return raw if raw is not None else epoch_to_timestamp(self.timestamps[i])
+
+    def event(self, i):
+        return self.events[self.event_codes[i]]
+
+    def message(self, i):
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], 'utf-8')
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError('로그 인덱스가 범위를 벗어났습니다.')
+        return {'timestamp': self.timestamp(i), 'event': self.event(i), 'message': self.message(i)}
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def close(self):
+        for view in getattr(self, '_views', []):
+            view.release()
+        self._views = []
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_log_cache(log_file, cache_file=None):
+    """열 단위 캐시를 연다. 없거나 로그 파일이 바뀌었으면 새로 만든다."""
+    cache_file = cache_file or log_file + '.colcache'
+    stat = os.stat(log_file)
+    try:
+        columns = LogColumns(cache_file)
+        if columns.source_size == stat.st_size and columns.source_mtime == stat.st_mtime:
+            return columns
+        columns.close()
+    except (FileNotFoundError, ValueError, struct.error):
+        pass
+    build_log_cache(log_file, cache_file)
+    return LogColumns(cache_file)
+
+def format_report_row(log):
+    """로그 하나를 Markdown 표의 한 행으로 변환한다."""
+    return f"| {log['timestamp']} | {log['event']} | {log['message']} |\n"
+
+# 분당 이벤트 수 히스토그램의 구간 하한. 마지막 구간은 상한이 없다.
+RATE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+class ReportAggregator:
+    """보고서에 들어갈 통계를 로그를 한 번 훑으면서 누적한다.
+
+    이벤트 유형별 횟수와 처음/마지막 발생 시각, 분당 이벤트 수, 키워드별 검출
+    횟수와 처음/마지막 검출 시각을 집계한다. 로그 자체는 보관하지 않는다.
+
+    분당 이벤트 수는 시간순으로 이어지는 같은 분의 로그를 세다가 분이 바뀌면
+    RATE_BUCKETS 구간의 히스토그램과 가장 바쁜 top_minutes개의 분에 반영한다.
+    따라서 로그 기간과 관계없이 메모리가 일정하다. 시간순이 아닌 로그에서 같은
+    분이 떨어져 다시 나오면 따로 센다. 구간별로 나누어 집계한 뒤 merge로 합칠 수
+    있도록, 첫 분과 마지막 분은 집계를 마칠 때까지 열어 둔다.
+    """
+
+    def __init__(self, keywords=(), top_minutes=10):
+        if isinstance(keywords, KeywordMatcher):
+            keywords = keywords.keywords
+        elif isinstance(keywords, str):
+            keywords = [keywords]
+        self.total = 0
+        self.first_timestamp = None
+        self.last_timestamp = None
+        self.event_stats = {}
+        self.top_minutes = top_minutes
+        self.minute_count = 0
+        self.rate_histogram = [0] * len(RATE_BUCKETS)
+        self.busiest_minutes = []
+        self._open_minutes = []  # [[분, 로그 수]], 첫 분과 마지막 분
+        self.keyword_stats = {keyword: [0, None, None] for keyword in keywords}
+
+    def add(self, log):
+        """로그 하나를 이벤트 통계에 반영한다. 헤더처럼 시각이 없는 줄은 건너뛴다."""
+        timestamp = log['timestamp']
+        if not timestamp[:1].isdigit():
+            return
+        self.total += 1
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        event = log['event']
+        stats = self.event_stats.get(event)
+        if stats is None:
+            self.event_stats[event] = [1, timestamp, timestamp]
+        else:
+            stats[0] += 1
+            stats[2] = timestamp
+        minute = timestamp[:16]
+        open_minutes = self._open_minutes
+        if open_minutes and open_minutes[-1][0] == minute:
+            open_minutes[-1][1] += 1
+        else:
+            self._start_minute(minute, 1)
+
+    def _start_minute(self, minute, count):
+        """새 분을 연다. 첫 분이 아닌 이전 마지막 분은 닫아서 통계에 반영한다."""
+        if len(self._open_minutes) == 2:
+            self._close_minute(*self._open_minutes.pop())
+        self._open_minutes.append([minute, count])
+
+    def _close_minute(self, minute, count):
+        """다 센 분 하나를 히스토그램과 가장 바쁜 분 목록에 반영한다."""
+        self.minute_count += 1
+        self.rate_histogram[bisect.bisect_right(RATE_BUCKETS, count) - 1] += 1
+        self._push_busiest(self.busiest_minutes, minute, count)
+
+    def _push_busiest(self, busiest, minute, count):
+        """가장 바쁜 분 목록에 넣고, top_minutes개를 넘으면 가장 한가한 분을 뺀다."""
+        busiest.append((minute, count))
+        if len(busiest) > self.top_minutes:
+            busiest.sort(key=lambda x: (-x[1], x[0]))
+            busiest.pop()
+
+    def minute_stats(self):
+        """(이벤트가 기록된 분 수, 히스토그램, 가장 바쁜 분 목록)을 반환한다.
+
+        열어 둔 분까지 반영한 사본을 만들므로 집계 상태는 바뀌지 않는다.
+        """
+        histogram = list(self.rate_histogram)
+        busiest = list(self.busiest_minutes)
+        for minute, count in self._open_minutes:
+            histogram[bisect.bisect_right(RATE_BUCKETS, count) - 1] += 1
+            self._push_busiest(busiest, minute, count)
+        busiest.sort(key=lambda x: (-x[1], x[0]))
+        return self.minute_count + len(self._open_minutes), histogram, busiest
+
+    def add_hits(self, log, hits):
+        """키워드가 검출된 로그를 키워드 통계에 반영한다."""
+        for keyword in hits:
+            stats = self.keyword_stats.setdefault(keyword, [0, None, None])
+            stats[0] += 1
+            if stats[1] is None:
+                stats[1] = log['timestamp']
+            stats[2] = log['timestamp']
+
+    def merge(self, other):
+        """뒤쪽 구간에서 따로 집계한 결과(other)를 이어 붙인다.
+
+        구간 순서대로 호출해야 처음/마지막 시각과 이벤트 유형의 순서가 한 번에
+        집계한 것과 같아진다.
+        """
+        self.total += other.total
+        if other.total:
+            if self.first_timestamp is None:
+                self.first_timestamp = other.first_timestamp
+            self.last_timestamp = other.last_timestamp
+        for event, (count, first, last) in other.event_stats.items():
+            stats = self.event_stats.get(event)
+            if stats is None:
+                self.event_stats[event] = [count, first, last]
+            else:
+                stats[0] += count
+                stats[2] = last
+        # 닫힌 분끼리는 순서와 관계없이 더하고, 열린 분은 경계에서 이어지는지 확인한다.
+        self.minute_count += other.minute_count
+        self.rate_histogram = [a + b for a, b in zip(self.rate_histogram, other.rate_histogram)]
+        for minute, count in other.busiest_minutes:
+            self._push_busiest(self.busiest_minutes, minute, count)
+        for minute, count in other._open_minutes:
+            if self._open_minutes and self._open_minutes[-1][0] == minute:
+                self._open_minutes[-1][1] += count
+            else:
+                self._start_minute(minute, count)
+        for keyword, (count, first, last) in other.keyword_stats.items():
+            stats = self.keyword_stats.setdefault(keyword, [0, None, None])
+            if count:
+                stats[0] += count
+                if stats[1] is None:
+                    stats[1] = first
+                stats[2] = last
+
+    def track(self, log_entries):
+        """로그 스트림을 그대로 흘려보내면서 이벤트 통계를 누적한다."""
         for log in log_entries:
-            if 'explosion' in log['message'].lower():
-                file.write(f"| {log['timestamp']} | {log['event']} | {log['message']} |\n")
+            self.add(log)
+            yield log
+
+    def write_summary(self, file):
+        """집계 결과를 Markdown으로 작성한다."""
+        minute_count, histogram, busiest = self.minute_stats()
+        file.write('## 5. 로그 통계\n')
+        file.write(f'- 전체 로그 수: {self.total}\n')
+        if self.total:
+            file.write(f'- 기록 기간: {self.first_timestamp} ~ {self.last_timestamp}\n')
+            file.write(f'- 이벤트가 기록된 분(minute) 수: {minute_count}\n')
+
+        file.write('\n### 이벤트 유형별 발생 현황\n')
+        file.write('| Event | Count | First | Last |\n')
+        file.write('|-------|-------|-------|------|\n')
+        for event, (count, first, last) in sorted(self.event_stats.items(), key=lambda x: -x[1][0]):
+            file.write(f'| {event} | {count} | {first} | {last} |\n')
 
-        file.write('\n## 3. 폭발 전후 로그\n')
-        file.write('| Timestamp | Event | Message |\n')
-        file.write('|-----------|-------|---------|\n')
+        file.write('\n### 키워드 검출 현황\n')
+        file.write('| Keyword | Count | First | Last |\n')
+        file.write('|---------|-------|-------|------|\n')
+        for keyword, (count, first, last) in self.keyword_stats.items():
+            file.write(f"| {keyword} | {count} | {first or '-'} | {last or '-'} |\n")
 
-        explosion_indices = [i for i, log in enumerate(log_entries) if 'explosion' in log['message'].lower()]
-        for index in explosion_indices:
-            start = max(0, index - 1)
-            end = min(len(log_entries), index + 2)
-            for log in log_entries[start:end]:
-                file.write(f"| {log['timestamp']} | {log['event']} | {log['message']} |\n")
+        file.write('\n### 분당 이벤트 수 분포\n')
+        file.write('| Events/min | Minutes |\n')
+        file.write('|------------|---------|\n')
+        for i, minutes in enumerate(histogram):
+            if not minutes:
+                continue
+            low = RATE_BUCKETS[i]
+            if i + 1 == len(RATE_BUCKETS):
+                label = f'{low}+'
+            elif RATE_BUCKETS[i + 1] - 1 == low:
+                label = f'{low}'
+            else:
+                label = f'{low}-{RATE_BUCKETS[i + 1] - 1}'
+            file.write(f'| {label} | {minutes} |\n')
 
-        file.write('\n## 4. 사고 원인 정리\n')
-        file.write('로그 분석 결과, **산소 탱크의 불안정한 상태(Oxygen tank unstable)** 이후 **산소 탱크 폭발(Oxygen tank explosion)** 이 발생한 것으로 확인됨.\n\n')
+        file.write(f'\n### 이벤트가 가장 많은 분 (상위 {self.top_minutes}개)\n')
+        file.write('| Minute | Count |\n')
+        file.write('|--------|-------|\n')
+        for minute, count in busiest:
+            file.write(f'| {minute} | {count} |\n')
+        file.write('\n')
+
+def write_report(file, match_rows, context_rows, aggregator=None):
+    """Markdown 표의 행들을 받아 사고 분석 보고서를 작성한다.
+
+    aggregator가 주어지면 마지막에 로그 통계를 덧붙인다.
+    """
+    file.write('# 사고 분석 보고서\n\n')
+    file.write('## 1. 사고 개요\n')
+    file.write('화성 기지 폭발 사고의 원인을 분석한다.\n\n')
+
+    file.write('## 2. 로그 분석\n')
+    file.write('| Timestamp | Event | Message |\n')
+    file.write('|-----------|-------|---------|\n')
+    for row in match_rows:
+        file.write(row)
+
+    file.write('\n## 3. 폭발 전후 로그\n')
+    file.write('| Timestamp | Event | Message |\n')
+    file.write('|-----------|-------|---------|\n')
+    for row in context_rows:
+        file.write(row)
+
+    file.write('\n## 4. 사고 원인 정리\n')
+    file.write('로그 분석 결과, **산소 탱크의 불안정한 상태(Oxygen tank unstable)** 이후 **산소 탱크 폭발(Oxygen tank explosion)** 이 발생한 것으로 확인됨.\n\n')
+
+    if aggregator is not None:
+        aggregator.write_summary(file)
+
+def generate_report(log_entries, report_file, keywords='explosion', matches=None, context_logs=None):
+    """사고 원인 분석 결과를 Markdown 파일로 저장한다.
+
+    키워드 검색은 한 번만 수행하고, 그 결과로 두 표와 로그 통계를 모두 만든다.
+    context_logs를 넘기면 폭발 전후 로그 표에 그 로그들을 사용한다.
+    """
+    if matches is None:
+        matches = find_keyword_matches(log_entries, keywords)
+    if context_logs is None:
+        context_logs = extract_logs(log_entries, keywords, matches=matches)
+
+    aggregator = ReportAggregator(keywords)
+    hits_by_index = dict(matches)
+    match_rows = []
+    for i, log in enumerate(log_entries):
+        aggregator.add(log)
+        hits = hits_by_index.get(i)
+        if hits:
+            aggregator.add_hits(log, hits)
+            match_rows.append(format_report_row(log))
+    context_rows = [format_report_row(log) for log in context_logs]
+    with open(report_file, 'w', encoding='utf-8') as file:
+        write_report(file, match_rows, context_rows, aggregator)
+
+def run_streaming(log_file, sorted_log_file, critical_log_file, report_file, keywords='explosion',
+                  memory_limit=64 * 1024 * 1024, merge_windows=False, before=1, after=1, workers=0):
+    """로그 분석을 스트리밍으로 수행한다.
+
+    log_file에 파일 목록을 넘기면 timestamp 순서로 병합하여 분석한다.
+    읽기 -> 파싱 -> 키워드 추출 -> 저장을 제너레이터로 연결하여 한 번의 패스로
+    critical_logs.txt와 보고서에 들어갈 행을 만든다. 보고서의 행은 임시 파일에
+    모아 두었다가 마지막에 순서대로 이어 붙이므로 메모리 사용량이 일정하다.
+    merge_windows가 True이면 겹치는 문맥 구간을 합쳐 중복 없이 추출한다.
+    workers는 압축된 로그를 병렬로 풀 때 사용할 프로세스 수이다.
+    결과는 임시 파일에 쓰고 두 패스가 모두 끝난 뒤에 교체하므로, 로그 파일을
+    읽다가 오류가 나면 출력 파일을 건드리지 않고 False를 반환한다.
+    """
+    if not check_log_files(log_file):
+        return False
+
+    outputs = [sorted_log_file, critical_log_file, report_file]
+    temp_files = {output: output + '.tmp' for output in outputs}
+    try:
+        # 정렬은 전체 로그가 필요하므로 별도의 패스에서 외부 병합 정렬로 처리한다.
+        external_sort_logs(iter_log_entries(log_file, workers, strict=True), temp_files[sorted_log_file],
+                           reverse=True, memory_limit=memory_limit)
+
+        aggregator = ReportAggregator(keywords)
+        log_entries = aggregator.track(iter_log_entries(log_file, workers, strict=True))
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as match_rows, \
+                tempfile.TemporaryFile('w+', encoding='utf-8') as context_rows:
+            def write_match(log, hits):
+                aggregator.add_hits(log, hits)
+                match_rows.write(format_report_row(log))
+
+            if merge_windows:
+                context_logs = iter_context_logs(log_entries, keywords, before, after, on_match=write_match)
+            else:
+                context_logs = iter_extract_logs(log_entries, keywords, on_match=write_match)
+
+            with open(temp_files[critical_log_file], 'w', encoding='utf-8') as critical_file:
+                for log in context_logs:
+                    critical_file.write(f"{log['timestamp']}, {log['event']}, {log['message']}\n")
+                    context_rows.write(format_report_row(log))
+
+            match_rows.seek(0)
+            context_rows.seek(0)
+            with open(temp_files[report_file], 'w', encoding='utf-8') as file:
+                write_report(file, match_rows, context_rows, aggregator)
+    except Exception as error:
+        print(f'Error: {error}')
+        for temp_file in temp_files.values():
+            try:
+                os.remove(temp_file)
+            except FileNotFoundError:
+                pass
+        return False
+
+    for output in outputs:
+        os.replace(temp_files[output], output)
+    return True
+
+def analyze_logs(log_entries, sorted_log_file, critical_log_file, report_file, keywords='explosion',
+                 merge_windows=False, before=1, after=1):
+    """메모리에 올린 로그로 정렬된 로그, 사고 로그, 보고서를 모두 만든다."""
+    save_logs(log_entries, sorted_log_file, sort=True, reverse=True)
+    matches = find_keyword_matches(log_entries, keywords)
+    if merge_windows:
+        critical_logs = list(iter_context_logs(log_entries, keywords, before, after))
+    else:
+        critical_logs = extract_logs(log_entries, keywords, matches=matches)
+    save_logs(critical_logs, critical_log_file)
+    generate_report(log_entries, report_file, keywords, matches=matches, context_logs=critical_logs)
+
+def _analyze_range(task):
+    """프로세스 풀에서 실행된다. 파일의 한 구간을 파싱하여 분석한다.
+
+    정렬된 run 파일을 directory에 기록하고, 로그 자체 대신 (로그 수, 키워드 검출
+    목록, 구간의 통계, 문맥 추출에 필요한 로그만 담은 사전, run 파일 경로)를
+    반환한다. 구간 경계를 넘는 문맥을 위해 앞쪽 after개와 뒤쪽 before개의 로그도
+    함께 돌려준다.
+    """
+    file_path, start, end, keywords, before, after, directory = task
+    log_entries = parse_logs(_read_range(file_path, start, end))
+    # 정렬은 analyze_logs와 같이 최신 로그가 먼저 오는 순서로 한다.
+    lines = [f"{log['timestamp']}, {log['event']}, {log['message']}\n" for log in log_entries]
+    run = _write_sampled_run(lines, True, directory)
+    del lines
+
+    matcher = _as_matcher(keywords)
+    aggregator = ReportAggregator(matcher)
+    matches = []
+    for i, log in enumerate(log_entries):
+        aggregator.add(log)
+        hits = matcher.find(log['message'])
+        if hits:
+            aggregator.add_hits(log, hits)
+            matches.append((i, hits))
+
+    count = len(log_entries)
+    needed = set(range(min(after, count))) | set(range(max(0, count - before), count))
+    for i, _ in matches:
+        needed.update(range(max(0, i - before), min(count, i + after + 1)))
+    return count, matches, {i: log_entries[i] for i in needed}, aggregator, run
+
+def parallel_analyze_logs(log_file, sorted_log_file, critical_log_file, report_file, keywords='explosion',
+                          merge_windows=False, before=1, after=1, workers=None, chunks_per_worker=4):
+    """analyze_logs와 같은 결과를 여러 프로세스에서 만든다.
+
+    로그 파일을 줄 단위로 정렬된 구간으로 나누어, 각 워커가 파싱, 구간 정렬(run),
+    키워드 검출, 통계 집계를 모두 처리한다. run 파일의 병합도 정렬 키 구간별로 나누어
+    같은 풀에서 수행한다(parallel_merge_runs). 부모 프로세스는 작은 결과만 합치므로
+    로그 딕셔너리를 프로세스 사이에 주고받지 않는다.
+    압축된 파일은 구간으로 나눌 수 없으므로 병렬로 풀면서 analyze_logs로 처리한다.
+    분석할 로그가 없으면 출력 파일을 건드리지 않고 False를 반환한다.
+    """
+    workers = workers or os.cpu_count() or 1
+    try:
+        if detect_compression(log_file):
+            log_entries = parse_logs(iter_log_lines(log_file, workers))
+            if not log_entries:
+                return False
+            analyze_logs(log_entries, sorted_log_file, critical_log_file, report_file, keywords,
+                         merge_windows, before, after)
+            return True
+        ranges = split_file_ranges(log_file, workers * chunks_per_worker)
+    except FileNotFoundError:
+        print('Error: 로그 파일을 찾을 수 없습니다.')
+        return False
+
+    if not merge_windows:
+        before = after = 1  # extract_logs의 기본 문맥(context=1)
+    matcher = _as_matcher(keywords)
+    aggregator = ReportAggregator(matcher)
+    matches = []
+    log_entries = {}
+    runs = []
+    total = 0
+    with tempfile.TemporaryDirectory() as directory:
+        tasks = [(log_file, start, end, matcher, before, after, directory) for start, end in ranges]
+        with Pool(workers) as pool:
+            for count, range_matches, range_entries, range_aggregator, run in pool.imap(_analyze_range, tasks):
+                matches.extend((total + i, hits) for i, hits in range_matches)
+                log_entries.update((total + i, log) for i, log in range_entries.items())
+                aggregator.merge(range_aggregator)
+                runs.append(run)
+                total += count
+            if total == 0:
+                return False
+            parallel_merge_runs(pool, runs, sorted_log_file, reverse=True, partitions=workers * 2)
+
+    # extract_logs와 iter_context_logs가 고르는 로그의 인덱스를 그대로 계산한다.
+    if merge_windows:
+        indexes = sorted({
+            i for index, _ in matches for i in range(max(0, index - before), min(total, index + after + 1))
+        })
+    else:
+        indexes = [i for index, _ in matches for i in range(max(0, index - 1), min(total, index + 2))]
+    critical_logs = [log_entries[i] for i in indexes]
+    save_logs(critical_logs, critical_log_file)
+
+    match_rows = [format_report_row(log_entries[index]) for index, _ in matches]
+    context_rows = [format_report_row(log) for log in critical_logs]
+    with open(report_file, 'w', encoding='utf-8') as file:
+        write_report(file, match_rows, context_rows, aggregator)
+    return True
 
 def main():
     """설치가 잘 되었는지 확인 하기 위해 출력"""
     print("Hello Mars")
 
     """로그 분석 실행"""
-    log_file = 'mission_computer_main.log'
     sorted_log_file = 'sorted_logs.txt'
     critical_log_file = 'critical_logs.txt'
     report_file = 'log_analysis.md'
 
-    logs = read_log_file(log_file)
-    if not logs:
+    parser = argparse.ArgumentParser(description='화성 기지 미션 로그 분석')
+    parser.add_argument('--log-file', nargs='+', default=['mission_computer_main.log'],
+                        help='분석할 로그 파일 (gzip/bz2/xz 압축 파일도 가능, 단 --range와 --follow는 제외). '
+                             '여러 개를 주면 timestamp 순서로 병합하여 분석한다')
+    parser.add_argument('--stream', action='store_true', help='로그를 한 줄씩 스트리밍으로 분석한다')
+    parser.add_argument('--sort-memory-mb', type=int, default=64, help='스트리밍 모드에서 정렬에 사용할 메모리 한도(MB)')
+    parser.add_argument('--range', nargs=2, metavar=('START', 'END'),
+                        help='색인을 이용해 START~END 구간의 로그만 출력한다 (예: "2023-08-27 11:30:00")')
+    parser.add_argument('--index-every', type=int, default=1000, help='색인에 표본을 기록할 줄 간격')
+    parser.add_argument('--keywords', default='explosion',
+                        help='사고 로그로 추출할 키워드 목록 (쉼표로 구분)')
+    parser.add_argument('--merge-windows', action='store_true',
+                        help='겹치는 문맥 구간을 합쳐 중복 없이 추출한다 (grep -B/-A 방식)')
+    parser.add_argument('--before', type=int, default=1, help='--merge-windows 사용 시 키워드 앞쪽 문맥 줄 수')
+    parser.add_argument('--after', type=int, default=1, help='--merge-windows 사용 시 키워드 뒤쪽 문맥 줄 수')
+    parser.add_argument('--follow', action='store_true',
+                        help='로그 파일에 새로 추가되는 로그를 계속 감시하며 키워드가 포함된 로그를 출력한다')
+    parser.add_argument('--checkpoint', help='팔로우 모드의 체크포인트 파일 (기본값: 로그 파일 이름.ckpt)')
+    parser.add_argument('--cache', action='store_true',
+                        help='한 번 파싱한 결과를 열 단위 바이너리 캐시(.colcache)로 저장해 두고 다시 사용한다')
+    parser.add_argument('--compact', action='store_true',
+                        help='로그를 딕셔너리 대신 가벼운 LogEntry로 메모리에 올린다 (timestamp는 epoch로 저장)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='여러 프로세스로 로그를 나누어 파싱하거나 gzip 멤버를 병렬로 푼다 (0이면 사용 안 함)')
+    args = parser.parse_args()
+    log_file = args.log_file[0] if len(args.log_file) == 1 else args.log_file
+    if not isinstance(log_file, str) and (args.follow or args.range or args.cache):
+        print('Error: --follow, --range, --cache는 로그 파일 하나만 지원합니다.')
         return
+    if args.follow or args.range:
+        # 두 모드는 바이트 오프셋으로 파일을 직접 읽으므로 압축 파일에는 쓸 수 없다.
+        try:
+            compression = detect_compression(log_file)
+        except FileNotFoundError:
+            compression = None
+        if compression:
+            print(f'Error: --follow, --range는 압축되지 않은 로그 파일만 지원합니다 ({compression}).')
+            return
 
-    log_entries = parse_logs(logs)
-    save_logs(log_entries, sorted_log_file, sort=True, reverse=True)
-    critical_logs = extract_logs(log_entries, 'explosion')
-    save_logs(critical_logs, critical_log_file)
-    generate_report(log_entries, report_file)
+    keywords = KeywordMatcher(keyword.strip() for keyword in args.keywords.split(',') if keyword.strip())
+
+    if args.follow:
+        try:
+            for log in follow_logs(log_file, args.checkpoint):
+                hits = keywords.find(log['message'])
+                if hits:
+                    print(f"[{', '.join(sorted(hits))}] {log['timestamp']}, {log['event']}, {log['message']}")
+        except KeyboardInterrupt:
+            print('팔로우 모드를 종료합니다.')
+        return
+
+    if args.range:
+        try:
+            index = load_time_index(log_file, every=args.index_every)
+        except FileNotFoundError:
+            print('Error: 로그 파일을 찾을 수 없습니다.')
+            return
+        for log in query_time_range(log_file, args.range[0], args.range[1], index):
+            print(f"{log['timestamp']}, {log['event']}, {log['message']}")
+        return
+
+    if args.stream:
+        if run_streaming(log_file, sorted_log_file, critical_log_file, report_file, keywords,
+                         memory_limit=args.sort_memory_mb * 1024 * 1024,
+                         merge_windows=args.merge_windows, before=args.before, after=args.after,
+                         workers=args.workers):
+            print("로그 분석 완료. 보고서가 작성되었습니다.")
+        return
+
+    if args.cache:
+        try:
+            log_entries = load_log_cache(log_file)
+        except FileNotFoundError:
+            print('Error: 로그 파일을 찾을 수 없습니다.')
+            return
+        if not log_entries:
+            return
+    elif not isinstance(log_file, str):
+        if not check_log_files(log_file):
+            return
+        try:
+            log_entries = list(iter_merged_logs(log_file, args.workers, strict=True))
+        except Exception as error:
+            print(f'Error: {error}')
+            return
+        if not log_entries:
+            return
+    elif args.workers > 0:
+        if parallel_analyze_logs(log_file, sorted_log_file, critical_log_file, report_file, keywords,
+                                 args.merge_windows, args.before, args.after, args.workers):
+            print("로그 분석 완료. 보고서가 작성되었습니다.")
+        return
+    else:
+        logs = read_log_file(log_file)
+        if not logs:
+            return
+        if args.compact:
+            log_entries = parse_logs_compact(logs, parse_timestamps=True)
+        else:
+            log_entries = parse_logs(logs)
+
+    analyze_logs(log_entries, sorted_log_file, critical_log_file, report_file, keywords,
+                 args.merge_windows, args.before, args.after)
     print("로그 분석 완료. 보고서가 작성되었습니다.")
 
 if __name__ == '__main__':
@@ -1,22 +1,93 @@
-def read_csv(file_path):
-    data = []
+import argparse
+import bisect
+import csv
+import gc
+import glob
+import heapq
+import itertools
+import json
+import math
+import mmap
+import os
+import struct
+import time
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 columnar 백엔드 없이 기본 방식으로만 동작한다.
+    np = None
+
+
+# 숫자 열에서 값이 없다는 뜻으로 쓰이는 표기. 이런 값은 None으로 읽는다.
+MISSING_VALUES = {'', 'Various', 'N/A', 'NA', 'Unknown', '-'}
+
+# 기존 read_csv와 같이 Flammability만 실수로 읽는 기본 스키마
+DEFAULT_SCHEMA = {'Flammability': 'float'}
+
+
+def _to_float(value):
+    # 실수로 바꿀 수 없는 값('Various' 등)은 None으로 처리하여 중단되지 않게 한다.
+    if value in MISSING_VALUES:
+        return None
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            header_line = file.readline().strip()
-            headers = header_line.split(',')
+        return float(value)
+    except ValueError:
+        return None
 
-            for line in file:
-                values = line.strip().split(',')
-                row = {}
-                for i in range(len(headers)):
-                    key = headers[i]
-                    value = values[i]
-                    if key == 'Flammability':
-                        row[key] = float(value)
-                    else:
-                        row[key] = value
-                data.append(row)
 
+def infer_schema(file_path, sample_size=1000):
+    # 앞부분 sample_size개 행을 보고 열마다 'float' 또는 'str' 타입을 정한다.
+    # 빈 값 표기(MISSING_VALUES)를 제외한 값이 모두 실수이면 'float' 열로 본다.
+    with open(file_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        headers = next(reader, [])
+        numeric = [True] * len(headers)
+        seen = [False] * len(headers)
+        for count, values in enumerate(reader):
+            if count >= sample_size:
+                break
+            for i, value in enumerate(values[:len(headers)]):
+                if value in MISSING_VALUES:
+                    continue
+                seen[i] = True
+                if numeric[i]:
+                    try:
+                        float(value)
+                    except ValueError:
+                        numeric[i] = False
+    return {
+        key: 'float' if numeric[i] and seen[i] else 'str'
+        for i, key in enumerate(headers)
+    }
+
+
+def iter_csv(file_path, schema=None):
+    # csv 모듈로 한 행씩 읽어 타입을 변환한 딕셔너리를 반환한다. (따옴표로 감싼 값도 처리)
+    # schema를 주지 않으면 infer_schema로 추론한다.
+    if schema is None:
+        schema = infer_schema(file_path)
+    with open(file_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        headers = next(reader, [])
+        converters = [_to_float if schema.get(key) == 'float' else None for key in headers]
+        for values in reader:
+            if not values:
+                continue
+            values += [''] * (len(headers) - len(values))
+            yield {
+                key: converter(value) if converter else value
+                for key, converter, value in zip(headers, converters, values)
+            }
+
+
+def read_csv(file_path, verbose=True, schema=DEFAULT_SCHEMA):
+    data = []
+    try:
+        for row in iter_csv(file_path, schema):
+            data.append(row)
+
+        if verbose:
             print('[1] CSV 파일에서 읽은 내용:')
             for item in data:
                 print(item)
@@ -27,48 +98,876 @@ def read_csv(file_path):
     return data
 
 
+def read_csv_columns(file_path, verbose=True, schema=DEFAULT_SCHEMA):
+    # read_csv와 같지만 결과를 InventoryColumns로 반환한다. 읽지 못하면 None을 반환한다.
+    columns = None
+    try:
+        columns = InventoryColumns.from_csv(file_path, schema)
+
+        if verbose:
+            print('[1] CSV 파일에서 읽은 내용:')
+            for item in columns.to_rows():
+                print(item)
+
+    except Exception as e:
+        print('CSV 파일 읽기 오류:', e)
+
+    return columns
+
+
+def _flammability_key(item):
+    # 인화성 값이 없는 항목은 가장 낮은 값으로 취급한다.
+    value = item['Flammability']
+    return value if value is not None else -math.inf
+
+
 def sort_by_flammability(data):
-    return sorted(data, key=lambda x: x['Flammability'], reverse=True)
+    return sorted(data, key=_flammability_key, reverse=True)
 
 
-def filter_dangerous_materials(data):
+def filter_dangerous_materials(data, threshold=0.7):
     result = []
     for item in data:
-        if item['Flammability'] >= 0.7:
+        if _flammability_key(item) >= threshold:
             result.append(item)
     return result
 
 
+def top_k_flammable(data, k):
+    # 인화성이 가장 높은 k개만 힙으로 골라낸다. O(n log k)이며 data는 스트림이어도 된다.
+    # 인화성이 같으면 먼저 나온 항목이 앞에 오므로 sort_by_flammability(data)[:k]와 같다.
+    return heapq.nlargest(k, data, key=_flammability_key)
+
+
+def select_dangerous_materials(data, threshold=0.7):
+    # 한 번 훑으면서 threshold 이상인 항목만 남긴 뒤 그 항목들만 정렬한다.
+    # 전체를 정렬한 다음 필터링하는 것과 결과가 같고, data는 스트림이어도 된다.
+    return sort_by_flammability(filter_dangerous_materials(data, threshold))
+
+
+def _load_sorted_inventory(file_path):
+    # 프로세스 풀에서 실행된다. CSV 하나를 읽어 (열 이름 목록, 인화성 순으로 정렬된 행)을 반환한다.
+    # 열 이름의 앞뒤 공백은 제거하고 인화성 열은 대소문자와 관계없이 Flammability(실수)로 맞춘다.
+    # 어느 기지에서 온 항목인지 Source 열에 파일 이름을 기록한다.
+    rows = []
+    for row in iter_csv(file_path, schema={}):
+        item = {}
+        for key, value in row.items():
+            key = key.strip()
+            if key.lower() == 'flammability':
+                key, value = 'Flammability', _to_float(value)
+            item[key] = value
+        item.setdefault('Flammability', None)
+        item['Source'] = os.path.basename(file_path)
+        rows.append(item)
+    headers = list(rows[0].keys()) if rows else []
+    return headers, sort_by_flammability(rows)
+
+
+def merge_inventories(results):
+    # 각 파일의 열 이름을 하나의 스키마로 맞춘다. 대소문자만 다른 열은 같은 열로 보고,
+    # 처음 나온 이름을 사용한다. 파일에 없는 열은 빈 값('')으로 채운다.
+    canonical = {}
+    for file_headers, _ in results:
+        for key in file_headers:
+            canonical.setdefault(key.lower(), key)
+    if 'flammability' in canonical:
+        canonical['flammability'] = 'Flammability'
+    headers = list(canonical.values())
+
+    def normalize(rows):
+        for row in rows:
+            item = dict.fromkeys(headers, '')
+            item['Flammability'] = None
+            for key, value in row.items():
+                item[canonical[key.lower()]] = value
+            yield item
+
+    # 파일마다 이미 정렬되어 있으므로 k-way 병합만 하면 전체가 인화성 순이 된다.
+    merged = heapq.merge(*(normalize(rows) for _, rows in results), key=_flammability_key, reverse=True)
+    return headers, list(merged)
+
+
+def load_inventory_directory(directory, workers=None, pattern='*.csv'):
+    # 디렉터리의 인벤토리 CSV를 프로세스 풀에서 동시에 읽고 정렬한 뒤 하나로 병합한다.
+    # 이전 실행에서 만든 위험 물질 파일(*_danger.csv)은 제외한다.
+    files = sorted(
+        path for path in glob.glob(os.path.join(directory, pattern))
+        if not path.endswith('_danger.csv')
+    )
+    if not files:
+        return [], []
+    with Pool(min(workers or os.cpu_count() or 1, len(files))) as pool:
+        results = pool.map(_load_sorted_inventory, files)
+    return merge_inventories(results)
+
+
+class InventoryColumns:
+    # 인벤토리를 열(column) 단위로 보관한다.
+    # 값이 모두 실수(또는 None)인 열은 float64 배열(numbers)과 None 위치를 표시한 마스크(nulls)로,
+    # 나머지 열은 값 사전(categories)과 코드 배열(codes)로 인코딩한다. 사전에는 원래 값을 그대로
+    # 넣으므로 to_rows로 되돌리면 None과 원래 타입이 유지된다.
+    # flammability는 정렬용 키 배열로, _flammability_key와 같이 값이 없는 항목은 -inf이다.
+    # 정렬은 argsort, 필터링은 불리언 마스크로 처리하므로 항목이 수백만 개여도 빠르다.
+
+    def __init__(self, headers, flammability, numbers, nulls, codes, categories):
+        self.headers = headers
+        self.flammability = flammability
+        self.numbers = numbers
+        self.nulls = nulls
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_rows(cls, data, headers=None):
+        if np is None:
+            raise ImportError('columnar 백엔드를 사용하려면 numpy가 필요합니다.')
+        if headers is None:
+            headers = list(data[0].keys()) if data else ['Flammability']
+        return cls._from_columns(headers, [[item[key] for item in data] for key in headers])
+
+    @classmethod
+    def from_csv(cls, file_path, schema=None):
+        # iter_csv와 같은 규칙으로 읽되, 행마다 딕셔너리를 만들지 않고 열 목록으로 바로 모은다.
+        if np is None:
+            raise ImportError('columnar 백엔드를 사용하려면 numpy가 필요합니다.')
+        if schema is None:
+            schema = infer_schema(file_path)
+        # 읽는 동안 생기는 행 리스트는 순환 참조를 만들지 않으므로, 세대별 GC가 커지는 열 목록을
+        # 반복해서 훑지 않도록 잠시 멈춘다.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as file:
+                reader = csv.reader(file)
+                headers = next(reader, [])
+                columns = [[] for _ in headers]
+                converters = [_to_float if schema.get(key) == 'float' else None for key in headers]
+                # 행 목록을 모두 들고 있지 않도록 일정 개수씩 읽어 열 방향으로 뒤집는다.
+                while chunk := list(itertools.islice(reader, 65536)):
+                    rows = []
+                    for values in chunk:
+                        if not values:
+                            continue
+                        if len(values) != len(headers):
+                            values = (values + [''] * len(headers))[:len(headers)]
+                        rows.append(values)
+                    for column, converter, values in zip(columns, converters, zip(*rows)):
+                        column.extend(map(converter, values) if converter else values)
+            return cls._from_columns(headers, columns)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    @classmethod
+    def _from_columns(cls, headers, columns):
+        numbers = {}
+        nulls = {}
+        codes = {}
+        categories = {}
+        for key, values in zip(headers, columns):
+            if set(map(type, values)) <= {float, type(None)}:
+                nulls[key] = np.array([value is None for value in values], dtype=bool)
+                numbers[key] = np.array(
+                    [-math.inf if value is None else value for value in values], dtype=np.float64
+                )
+            else:
+                # 처음 나온 순서대로 번호를 매긴 값 사전으로 코드 배열을 만든다.
+                lookup = dict.fromkeys(values)
+                for code, value in enumerate(lookup):
+                    lookup[value] = code
+                codes[key] = np.fromiter(map(lookup.__getitem__, values), dtype=np.int32, count=len(values))
+                categories[key] = list(lookup)
+        if 'Flammability' in numbers:
+            flammability = numbers['Flammability']
+        else:
+            values = columns[headers.index('Flammability')] if 'Flammability' in headers else []
+            flammability = np.array([-math.inf if value is None else value for value in values], dtype=np.float64)
+        return cls(headers, flammability, numbers, nulls, codes, categories)
+
+    def __len__(self):
+        return len(self.flammability)
+
+    def take(self, indices):
+        # indices(정수 배열 또는 불리언 마스크)에 해당하는 항목만 골라 새 객체를 만든다.
+        numbers = {key: column[indices] for key, column in self.numbers.items()}
+        nulls = {key: column[indices] for key, column in self.nulls.items()}
+        codes = {key: column[indices] for key, column in self.codes.items()}
+        flammability = numbers['Flammability'] if 'Flammability' in numbers else self.flammability[indices]
+        return InventoryColumns(self.headers, flammability, numbers, nulls, codes, self.categories)
+
+    def sort_by_flammability(self):
+        # sorted(..., reverse=True)와 같이 인화성이 같은 항목은 원래 순서를 유지한다.
+        order = np.argsort(-self.flammability, kind='stable')
+        return self.take(order)
+
+    def filter_dangerous_materials(self, threshold=0.7):
+        return self.take(self.flammability >= threshold)
+
+    def column(self, key):
+        # 한 열의 값을 파이썬 리스트로 반환한다. 값이 없던 자리는 None이다.
+        if key in self.numbers:
+            return [
+                None if missing else value
+                for value, missing in zip(self.numbers[key].tolist(), self.nulls[key].tolist())
+            ]
+        names = self.categories[key]
+        return [names[code] for code in self.codes[key].tolist()]
+
+    def to_rows(self):
+        # 기존 함수(save_to_csv 등)에서 사용할 수 있도록 딕셔너리 목록으로 되돌린다.
+        columns = [self.column(key) for key in self.headers]
+        return [dict(zip(self.headers, values)) for values in zip(*columns)]
+
+    def _text_column(self, key):
+        # save_to_csv와 같이 None은 빈 문자열로, 나머지는 str()로 바꾼 열을 반환한다.
+        if key in self.numbers:
+            return ['' if value is None else str(value) for value in self.column(key)]
+        names = ['' if value is None else str(value) for value in self.categories[key]]
+        return [names[code] for code in self.codes[key].tolist()]
+
+    def save_to_csv(self, file_path):
+        # save_to_csv(file_path, self.to_rows(), self.headers)와 같은 파일을 딕셔너리 없이 쓴다.
+        try:
+            with open(file_path, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.writer(file, lineterminator='\n')
+                writer.writerow(self.headers)
+                writer.writerows(zip(*(self._text_column(key) for key in self.headers)))
+        except Exception as e:
+            print('CSV 저장 오류:', e)
+
+    def save_to_binary(self, file_path, source=None):
+        # save_to_binary(file_path, self.to_rows(), source)와 같은 파일을 열 단위 배열 연산으로 만든다.
+        try:
+            types = ['d' if key in self.numbers else 'I' for key in self.headers]
+
+            # 문자열 테이블 번호는 행 순서대로, 한 행 안에서는 열 순서대로 처음 나온 순서로 매긴다.
+            first_seen = {}
+            for column_index, key in enumerate(self.headers):
+                if key in self.numbers:
+                    continue
+                names = [str(value) for value in self.categories[key]]
+                present, first_rows = np.unique(self.codes[key], return_index=True)
+                for code, row in zip(present.tolist(), first_rows.tolist()):
+                    position = (row, column_index)
+                    if position < first_seen.get(names[code], (math.inf, 0)):
+                        first_seen[names[code]] = position
+            strings = sorted(first_seen, key=first_seen.get)
+            string_ids = {text: i for i, text in enumerate(strings)}
+
+            record_type = np.dtype([
+                (f'f{i}', '<f8' if column_type == 'd' else '<u4') for i, column_type in enumerate(types)
+            ])
+            records = np.zeros(len(self), dtype=record_type)
+            string_columns = {}
+            for i, key in enumerate(self.headers):
+                if key in self.numbers:
+                    records[f'f{i}'] = np.where(self.nulls[key], math.nan, self.numbers[key])
+                else:
+                    ids = np.array(
+                        [string_ids.get(str(value), 0) for value in self.categories[key]], dtype=np.uint32
+                    )
+                    string_columns[i] = ids[self.codes[key]]
+                    records[f'f{i}'] = string_columns[i]
+
+            # 푸터 색인: 첫 번째 열의 문자열 순서대로 정렬한 레코드 번호
+            footer = b''
+            if self.headers and types[0] == 'I':
+                rank = np.empty(len(strings), dtype=np.int64)
+                rank[sorted(range(len(strings)), key=strings.__getitem__)] = np.arange(len(strings))
+                order = np.argsort(rank[string_columns[0]], kind='stable')
+                footer = order.astype('<u4').tobytes()
+
+            _write_binary(file_path, self.headers, types, strings, record_type.itemsize, len(self),
+                          [records.tobytes()], footer, source)
+        except Exception as e:
+            print('이진 파일 저장 오류:', e)
+
+
 def save_to_csv(file_path, data, headers):
     try:
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(','.join(headers) + '\n')
+        with open(file_path, 'w', encoding='utf-8', newline='') as file:
+            # 쉼표가 들어 있는 값은 csv 모듈이 따옴표로 감싸 준다.
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow(headers)
             for item in data:
                 values = []
                 for key in headers:
-                    values.append(str(item[key]))
-                line = ','.join(values)
-                file.write(line + '\n')
+                    values.append('' if item[key] is None else str(item[key]))
+                writer.writerow(values)
     except Exception as e:
         print('CSV 저장 오류:', e)
 
 
-def save_to_binary(file_path, data):
+# 이진 파일 구조
+#   [헤더] magic, 버전, 열 개수, 레코드 크기, 레코드 수, 각 구간의 위치, 원본 CSV의 크기와 수정 시각
+#   [스키마] 열마다 (이름 길이, 이름, 타입) - 타입 'd'는 float64, 'I'는 문자열 테이블 번호
+#   [문자열 테이블] 문자열 개수, uint32 오프셋 배열, UTF-8 바이트
+#   [레코드] 고정 크기로 압축(pack)된 레코드들
+#   [푸터 색인] 첫 번째 열(Substance) 값 순서로 정렬된 레코드 번호 배열 - 이름으로 이진 탐색
+BINARY_MAGIC = b'MARSINV1'
+BINARY_VERSION = 2
+BINARY_HEADER = struct.Struct('<8sHHIQQQQQQd')
+FOOTER_ENTRY = struct.Struct('<I')
+
+
+def _column_types(data, headers):
+    # 모든 값이 실수인 열은 float64로, 나머지는 문자열 테이블 번호로 저장한다.
+    types = []
+    for key in headers:
+        if data and all(isinstance(item[key], float) or item[key] is None for item in data):
+            types.append('d')
+        else:
+            types.append('I')
+    return types
+
+
+def _source_stamp(source):
+    # 이진 파일을 만든 원본 CSV의 (크기, 수정 시각). 원본이 없으면 (0, 0.0)
+    if source is None:
+        return 0, 0.0
+    stat = os.stat(source)
+    return stat.st_size, stat.st_mtime
+
+
+def save_to_binary(file_path, data, source=None):
+    # source는 data를 읽은 CSV 경로이며, 헤더에 그 크기와 수정 시각을 기록한다.
     try:
-        with open(file_path, 'wb') as file:
-            for item in data:
-                line = ','.join(str(item[key]) for key in item)
-                file.write((line + '\n').encode('utf-8'))
+        headers = list(data[0].keys()) if data else []
+        types = _column_types(data, headers)
+        record_struct = struct.Struct('<' + ''.join(types))
+
+        # 문자열 테이블: 같은 문자열은 한 번만 저장한다.
+        string_ids = {}
+        records = []
+        for item in data:
+            values = []
+            for key, column_type in zip(headers, types):
+                if column_type == 'd':
+                    values.append(math.nan if item[key] is None else item[key])
+                else:
+                    values.append(string_ids.setdefault(str(item[key]), len(string_ids)))
+            records.append(values)
+
+        # 푸터 색인: 첫 번째 열의 문자열 순서대로 정렬한 레코드 번호
+        footer = b''
+        if headers and types[0] == 'I':
+            names = list(string_ids)
+            order = sorted(range(len(records)), key=lambda i: names[records[i][0]])
+            footer = struct.pack(f'<{len(order)}I', *order)
+
+        _write_binary(file_path, headers, types, list(string_ids), record_struct.size, len(records),
+                      (record_struct.pack(*values) for values in records), footer, source)
     except Exception as e:
         print('이진 파일 저장 오류:', e)
 
 
-def read_binary_file(file_path):
+def _write_binary(file_path, headers, types, strings, record_size, record_count, record_chunks, footer,
+                  source=None):
+    # 헤더, 스키마, 문자열 테이블, 레코드(record_chunks의 바이트들), 푸터 색인 순서로 파일을 쓴다.
+    schema = b''
+    for key, column_type in zip(headers, types):
+        name = key.encode('utf-8')
+        schema += struct.pack('<H', len(name)) + name + column_type.encode('ascii')
+
+    encoded = [text.encode('utf-8') for text in strings]
+    offsets = [0]
+    for text in encoded:
+        offsets.append(offsets[-1] + len(text))
+    string_table = struct.pack(f'<I{len(offsets)}I', len(encoded), *offsets) + b''.join(encoded)
+
+    schema_offset = BINARY_HEADER.size
+    strings_offset = schema_offset + len(schema)
+    records_offset = strings_offset + len(string_table)
+    records_offset += -records_offset % 8
+    footer_offset = records_offset + record_size * record_count
+
+    with open(file_path, 'wb') as file:
+        file.write(BINARY_HEADER.pack(
+            BINARY_MAGIC, BINARY_VERSION, len(headers), record_size, record_count,
+            schema_offset, strings_offset, records_offset, footer_offset, *_source_stamp(source),
+        ))
+        file.write(schema)
+        file.write(string_table)
+        file.write(b'\0' * (records_offset - strings_offset - len(string_table)))
+        for chunk in record_chunks:
+            file.write(chunk)
+        file.write(footer)
+
+
+class InventoryBinaryFile:
+    # save_to_binary로 저장한 파일을 메모리 매핑하여 읽는다.
+    # 레코드 크기가 고정되어 있으므로 N번째 레코드나 일부 구간만 바로 꺼낼 수 있다.
+
+    def __init__(self, file_path):
+        self._file = open(file_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError('빈 이진 파일입니다.')
+        (magic, version, column_count, record_size, self.record_count, schema_offset,
+         strings_offset, self._records_offset, self._footer_offset,
+         self.source_size, self.source_mtime) = BINARY_HEADER.unpack_from(self._map)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            self.close()
+            raise ValueError('지원하지 않는 이진 파일 형식입니다.')
+
+        self.headers = []
+        types = ''
+        position = schema_offset
+        for _ in range(column_count):
+            (length,) = struct.unpack_from('<H', self._map, position)
+            position += 2
+            self.headers.append(self._map[position:position + length].decode('utf-8'))
+            types += chr(self._map[position + length])
+            position += length + 1
+        self._types = types
+        self._record = struct.Struct('<' + types)
+
+        (string_count,) = struct.unpack_from('<I', self._map, strings_offset)
+        self._string_offsets = struct.unpack_from(f'<{string_count + 1}I', self._map, strings_offset + 4)
+        self._strings_start = strings_offset + 4 + 4 * (string_count + 1)
+        self._strings = {}
+
+    def _string(self, string_id):
+        # 문자열은 처음 사용할 때만 디코딩하여 캐시한다.
+        text = self._strings.get(string_id)
+        if text is None:
+            start = self._strings_start + self._string_offsets[string_id]
+            end = self._strings_start + self._string_offsets[string_id + 1]
+            text = self._map[start:end].decode('utf-8')
+            self._strings[string_id] = text
+        return text
+
+    def _decode(self, values):
+        return {
+            key: self._string(value) if column_type == 'I' else (None if math.isnan(value) else value)
+            for key, column_type, value in zip(self.headers, self._types, values)
+        }
+
+    def __len__(self):
+        return self.record_count
+
+    def value(self, index, column):
+        # index번째 레코드의 한 열 값만 읽는다.
+        offset = self._records_offset + index * self._record.size
+        position = self.headers.index(column)
+        value = self._record.unpack_from(self._map, offset)[position]
+        if self._types[position] == 'I':
+            return self._string(value)
+        return None if math.isnan(value) else value
+
+    def record(self, index):
+        if index < 0:
+            index += self.record_count
+        if not 0 <= index < self.record_count:
+            raise IndexError('레코드 번호가 범위를 벗어났습니다.')
+        offset = self._records_offset + index * self._record.size
+        return self._decode(self._record.unpack_from(self._map, offset))
+
+    def records(self, start=0, stop=None):
+        start, stop, _ = slice(start, stop).indices(self.record_count)
+        if start >= stop:
+            return []
+        size = self._record.size
+        begin = self._records_offset + start * size
+        chunk = self._map[begin:begin + (stop - start) * size]
+        return [self._decode(values) for values in self._record.iter_unpack(chunk)]
+
+    def find_index(self, name):
+        # 푸터 색인에서 첫 번째 열(Substance) 값으로 이진 탐색하여 레코드 번호를 반환한다.
+        if not self.headers or self._types[0] != 'I':
+            return None
+        # 푸터 전체를 풀지 않고 이진 탐색이 읽는 항목만 꺼내므로 조회 한 번이 O(log n)이다.
+        keys = _IndexedKeys(self)
+        position = bisect.bisect_left(keys, name)
+        if position < self.record_count and keys[position] == name:
+            return self._footer_entry(position)
+        return None
+
+    def _footer_entry(self, position):
+        # 푸터 색인의 position번째 레코드 번호
+        return FOOTER_ENTRY.unpack_from(self._map, self._footer_offset + position * FOOTER_ENTRY.size)[0]
+
+    def find(self, name):
+        index = self.find_index(name)
+        return None if index is None else self.record(index)
+
+    def string_ids(self):
+        # 문자열 테이블 전체를 {문자열: 번호} 사전으로 반환한다.
+        return {self._string(i): i for i in range(len(self._string_offsets) - 1)}
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _IndexedKeys:
+    # bisect가 푸터 색인 순서대로 첫 번째 열 값을 읽을 수 있게 해 주는 보조 시퀀스
+
+    def __init__(self, binary_file):
+        self._binary_file = binary_file
+
+    def __len__(self):
+        return self._binary_file.record_count
+
+    def __getitem__(self, position):
+        binary_file = self._binary_file
+        offset = binary_file._records_offset + binary_file._footer_entry(position) * binary_file._record.size
+        return binary_file._string(binary_file._record.unpack_from(binary_file._map, offset)[0])
+
+
+def build_flammability_index(binary_path, data, source=None):
+    # main과 같이 인화성 내림차순으로 정렬한 인벤토리를 이진 파일로 저장한다.
+    # 이진 파일의 레코드가 이미 인화성 순이므로 별도의 색인 파일 없이 그대로 색인으로 쓴다.
+    save_to_binary(binary_path, sort_by_flammability(data), source)
+
+
+class FlammabilityIndex:
+    # 인화성 순으로 정렬되어 저장된 이진 파일에서 임계값/구간 조회를 한다.
+    # 조회마다 이진 탐색 두 번(O(log n))으로 연속된 레코드 구간을 찾고 그 구간만 읽는다.
+
+    def __init__(self, binary_path):
+        self._file = InventoryBinaryFile(binary_path)
+        self._keys = _NegatedFlammability(self._file)
+
+    def __len__(self):
+        return len(self._file)
+
+    def at_least(self, threshold):
+        # 인화성 >= threshold 인 항목 (인화성 높은 순)
+        stop = bisect.bisect_right(self._keys, -threshold)
+        return self._file.records(0, stop)
+
+    def between(self, low, high):
+        # low <= 인화성 <= high 인 항목 (인화성 높은 순)
+        start = bisect.bisect_left(self._keys, -high)
+        stop = bisect.bisect_right(self._keys, -low)
+        return self._file.records(start, stop)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _NegatedFlammability:
+    # 내림차순으로 저장된 인화성을 bisect가 쓸 수 있도록 부호를 바꿔 오름차순으로 보여 준다.
+    # 인화성이 없는 항목(맨 뒤)은 +inf로 보여 어떤 조회에도 포함되지 않게 한다.
+
+    def __init__(self, binary_file):
+        self._binary_file = binary_file
+
+    def __len__(self):
+        return len(self._binary_file)
+
+    def __getitem__(self, index):
+        value = self._binary_file.value(index, 'Flammability')
+        return math.inf if value is None else -value
+
+
+def _binary_matches(binary_path, csv_file, schema):
+    # 이진 파일이 지금의 csv_file을 schema로 읽어 만든 것인지 확인한다. 헤더에 기록된 원본의 크기와
+    # 수정 시각, 열 이름, 열 타입(schema가 'float'인 열만 실수)이 모두 같아야 한다.
+    # 없거나 형식이 다른 파일(이전 버전 등)도 False이다.
+    with open(csv_file, 'r', encoding='utf-8', newline='') as file:
+        headers = next(csv.reader(file), [])
+    types = ''.join('d' if schema.get(key) == 'float' else 'I' for key in headers)
+    try:
+        with InventoryBinaryFile(binary_path) as binary_file:
+            return ((binary_file.source_size, binary_file.source_mtime) == _source_stamp(csv_file)
+                    and binary_file.headers == headers and binary_file._types == types)
+    except (FileNotFoundError, ValueError, struct.error):
+        return False
+
+
+def load_flammability_index(csv_file, binary_path, schema=DEFAULT_SCHEMA):
+    # 이진 파일이 이 CSV를 같은 schema로 읽어 만든 것이 아니면 새로 만든 뒤 연다.
+    # schema가 None이면 infer_schema로 추론한다(--infer-types).
+    if schema is None:
+        schema = infer_schema(csv_file)
+    if not _binary_matches(binary_path, csv_file, schema):
+        build_flammability_index(binary_path, read_csv(csv_file, verbose=False, schema=schema), csv_file)
+    return FlammabilityIndex(binary_path)
+
+
+def _pack_record(binary_file, string_ids, item):
+    # 항목 하나를 이진 파일의 레코드 형식으로 압축한다. 열 구성이 다르거나, 실수 열에 실수가 아닌 값이
+    # 있거나(또는 그 반대), 문자열 테이블에 없는 문자열이 있으면 None을 반환한다.
+    if list(item.keys()) != binary_file.headers:
+        return None
+    values = []
+    for column, column_type in zip(binary_file.headers, binary_file._types):
+        value = item[column]
+        if column_type == 'd':
+            if value is not None and not isinstance(value, float):
+                return None
+            values.append(math.nan if value is None else value)
+        else:
+            string_id = None if isinstance(value, float) else string_ids.get(str(value))
+            if string_id is None:
+                return None
+            values.append(string_id)
+    return binary_file._record.pack(*values)
+
+
+def patch_binary_records(file_path, records, key='Substance'):
+    # (레코드 번호, 항목) 목록을 이진 파일에서 제자리에 덮어쓴다. 정렬 위치는 호출하는 쪽에서 맞춘다.
+    # 이름이 바뀌면 푸터 색인도 바뀌고, 새 문자열은 문자열 테이블에 추가해야 하므로 그런 수정이 있으면
+    # False를 반환한다.
+    patches = []
+    with InventoryBinaryFile(file_path) as binary_file:
+        if not binary_file.headers or binary_file.headers[0] != key:
+            return False
+        string_ids = binary_file.string_ids()
+        for index, item in records:
+            if index >= len(binary_file) or binary_file.value(index, key) != item[key]:
+                return False
+            record = _pack_record(binary_file, string_ids, item)
+            if record is None:
+                return False
+            patches.append((binary_file._records_offset + index * binary_file._record.size, record))
+
+    with open(file_path, 'r+b') as file:
+        for offset, data in patches:
+            file.seek(offset)
+            file.write(data)
+    return True
+
+
+def rewrite_binary_tail(file_path, data, start):
+    # data(정렬된 전체 인벤토리) 중 start번째 이후의 레코드와 푸터 색인만 다시 쓴다.
+    # 앞쪽 start개 레코드는 그대로 두므로 문자열 테이블에 없는 문자열이 필요하면 False를 반환한다.
+    # 삭제된 항목의 문자열은 테이블에 남지만 읽는 데는 영향이 없다.
+    with InventoryBinaryFile(file_path) as binary_file:
+        if not data or start > len(binary_file):
+            return False
+        string_ids = binary_file.string_ids()
+        chunk = bytearray()
+        for item in itertools.islice(data, start, None):
+            record = _pack_record(binary_file, string_ids, item)
+            if record is None:
+                return False
+            chunk += record
+        headers = binary_file.headers
+        record_size = binary_file._record.size
+        records_offset = binary_file._records_offset
+        magic, version, column_count, _, _, schema_offset, strings_offset, _, _, source_size, source_mtime = \
+            BINARY_HEADER.unpack_from(binary_file._map)
+        has_footer = binary_file._types[0] == 'I'
+
+    # 푸터 색인: 첫 번째 열의 문자열 순서대로 정렬한 레코드 번호
+    footer = b''
+    if has_footer:
+        names = [str(item[headers[0]]) for item in data]
+        order = sorted(range(len(data)), key=names.__getitem__)
+        footer = struct.pack(f'<{len(order)}I', *order)
+
+    footer_offset = records_offset + record_size * len(data)
+    with open(file_path, 'r+b') as file:
+        file.seek(records_offset + record_size * start)
+        file.write(chunk)
+        file.write(footer)
+        file.truncate()
+        file.seek(0)
+        file.write(BINARY_HEADER.pack(
+            magic, version, column_count, record_size, len(data),
+            schema_offset, strings_offset, records_offset, footer_offset, source_size, source_mtime,
+        ))
+    return True
+
+
+def stamp_binary_source(file_path, source):
+    # 제자리에서 고친 이진 파일의 헤더에 원본 CSV(source)의 크기와 수정 시각을 다시 기록한다.
+    with open(file_path, 'r+b') as file:
+        fields = list(BINARY_HEADER.unpack(file.read(BINARY_HEADER.size)))
+        fields[-2:] = _source_stamp(source)
+        file.seek(0)
+        file.write(BINARY_HEADER.pack(*fields))
+
+
+def _row_ids(rows, key='Substance'):
+    # 같은 이름이 여러 번 나올 수 있으므로 (이름, 몇 번째 등장) 쌍으로 행을 구분한다.
+    seen = {}
+    ids = []
+    for item in rows:
+        count = seen.get(item[key], 0)
+        seen[item[key]] = count + 1
+        ids.append((item[key], count))
+    return ids
+
+
+def sorted_positions(inventory):
+    # sort_by_flammability와 같은 순서를 CSV 행 번호 목록으로 반환한다.
+    return sorted(range(len(inventory)), key=lambda i: _flammability_key(inventory[i]), reverse=True)
+
+
+# 스냅샷은 기준 파일(JSON)과 그 뒤의 변경 기록(JSON lines, snapshot_path + '.log')으로 저장한다.
+# 변경 기록이 기준 파일 크기의 이 비율을 넘으면 하나의 기준 파일로 합친다.
+SNAPSHOT_COMPACT_RATIO = 0.5
+
+
+def _snapshot_log_path(snapshot_path):
+    return snapshot_path + '.log'
+
+
+def _snapshot_mtime(snapshot_path):
+    # 스냅샷이 마지막으로 기록된 시각 (기준 파일과 변경 기록 중 늦은 쪽)
+    log_path = _snapshot_log_path(snapshot_path)
+    mtime = os.path.getmtime(snapshot_path)
+    if os.path.exists(log_path):
+        mtime = max(mtime, os.path.getmtime(log_path))
+    return mtime
+
+
+def _apply_snapshot_delta(rows, delta):
+    # 지난 인벤토리의 [start, stop) 구간을 기록된 행들로 바꾼다.
+    rows[delta['start']:delta['stop']] = delta['rows']
+    return rows
+
+
+def load_snapshot(snapshot_path):
+    # 기준 파일에 변경 기록을 차례로 적용하여 지난 실행의 인벤토리(CSV 순서)를 복원한다.
+    # 없거나 읽을 수 없으면 None을 반환한다.
     try:
-        with open(file_path, 'rb') as file:
+        with open(snapshot_path, 'r', encoding='utf-8') as file:
+            snapshot = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+    rows = snapshot['rows']
+    try:
+        with open(_snapshot_log_path(snapshot_path), 'r', encoding='utf-8') as file:
+            for line in file:
+                delta = json.loads(line)
+                # 합치기 전에 남은 예전 기록은 건너뛴다.
+                if delta['generation'] == snapshot.get('generation'):
+                    rows = _apply_snapshot_delta(rows, delta)
+    except FileNotFoundError:
+        pass
+    except (ValueError, KeyError, IndexError, StopIteration):
+        # 쓰다 만 기록이 있으면 스냅샷을 믿을 수 없으므로 전체를 다시 처리하게 한다.
+        return None
+    return {'headers': snapshot['headers'], 'rows': rows, 'generation': snapshot.get('generation')}
+
+
+def save_snapshot(snapshot_path, headers, inventory):
+    # 기준 파일을 새로 쓰고 변경 기록을 비운다. 세대 번호가 바뀌므로 지우기 전에 중단되어도
+    # 남은 예전 기록은 적용되지 않는다.
+    temp_path = snapshot_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump({'headers': headers, 'rows': inventory, 'generation': time.time_ns()}, file, ensure_ascii=False)
+    os.replace(temp_path, snapshot_path)
+    if os.path.exists(_snapshot_log_path(snapshot_path)):
+        os.remove(_snapshot_log_path(snapshot_path))
+
+
+def append_snapshot_delta(snapshot_path, generation, delta):
+    # 변경 기록 한 줄을 덧붙인다. 기록이 커지면 False를 반환하여 기준 파일로 합치게 한다.
+    log_path = _snapshot_log_path(snapshot_path)
+    with open(log_path, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(dict(delta, generation=generation), ensure_ascii=False) + '\n')
+    return os.path.getsize(log_path) <= os.path.getsize(snapshot_path) * SNAPSHOT_COMPACT_RATIO
+
+
+def diff_inventory(old_rows, new_rows, key='Substance'):
+    # (이름, 등장 순번)을 기준으로 추가, 수정, 삭제된 행의 id를 구한다.
+    old_items = dict(zip(_row_ids(old_rows, key), old_rows))
+    new_items = dict(zip(_row_ids(new_rows, key), new_rows))
+    inserts = [row_id for row_id in new_items if row_id not in old_items]
+    updates = [row_id for row_id, item in new_items.items() if row_id in old_items and old_items[row_id] != item]
+    removals = [row_id for row_id in old_items if row_id not in new_items]
+    return inserts, updates, removals
+
+
+def snapshot_delta(old_rows, new_rows):
+    # 앞뒤로 같은 행을 빼고 남은 가운데 구간을 바뀐 부분으로 본다.
+    # 지난 인벤토리의 [start, stop) 구간을 rows로 바꾸면 새 인벤토리가 된다.
+    limit = min(len(old_rows), len(new_rows))
+    start = 0
+    while start < limit and old_rows[start] == new_rows[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old_rows[-1 - end] == new_rows[-1 - end]:
+        end += 1
+    return {'start': start, 'stop': len(old_rows) - end, 'rows': new_rows[start:len(new_rows) - end]}
+
+
+def update_incrementally(inventory, snapshot_path, danger_csv_file, binary_file, key='Substance', source=None):
+    # 지난 스냅샷과 비교하여 바뀐 부분만 출력 파일에 반영한다. source는 inventory를 읽은 CSV 경로이다.
+    # 처리하지 못하는 경우(첫 실행, 열 구성 변경, 스냅샷 이후에 이진 파일이 따로 바뀜)에는
+    # False를 반환하여 전체 처리를 하게 한다.
+    headers = list(inventory[0].keys()) if inventory else []
+    snapshot = load_snapshot(snapshot_path)
+    if snapshot is None or snapshot['headers'] != headers or key not in headers:
+        return False
+    if not os.path.exists(binary_file) or os.path.getmtime(binary_file) > _snapshot_mtime(snapshot_path):
+        return False
+
+    old_rows = snapshot['rows']
+    delta = snapshot_delta(old_rows, inventory)
+    start, stop = delta['start'], delta['stop']
+    new_stop = start + len(delta['rows'])
+    old_window = old_rows[start:stop]
+    inserts, updates, removals = diff_inventory(old_window, delta['rows'], key)
+    print(f'[증분 처리] 추가 {len(inserts)}개, 수정 {len(updates)}개, 삭제 {len(removals)}개')
+    if start == stop == new_stop:
+        return True
+
+    order = sorted_positions(inventory)
+    sorted_inventory = [inventory[i] for i in order]
+
+    # 바뀐 구간 밖의 행은 CSV에서의 앞뒤 순서가 그대로이므로, 위험 물질(인화성 ≥ 0.7)이
+    # 바뀐 구간에 없으면 위험 물질 목록도 그대로이다. 이때는 위험 물질 CSV를 다시 쓰지 않는다.
+    if any(_flammability_key(item) >= 0.7 for item in old_window + delta['rows']):
+        danger_list = filter_dangerous_materials(sorted_inventory)
+        if danger_list:
+            save_to_csv(danger_csv_file, danger_list, headers)
+        elif os.path.exists(danger_csv_file):
+            os.remove(danger_csv_file)
+
+    # 이진 파일: 정렬된 위치마다 지난번과 같은 행인지 비교한다. 바뀐 구간 밖의 행은 새 CSV 위치로
+    # 옮겨서 비교하고, 바뀐 구간의 행은 None으로 둔다. 처음 달라지는 곳(first) 앞에서 바뀐 구간의
+    # 행이 놓인 자리는 제자리에서 고치고, first부터는 뒤쪽만 다시 쓴다. 안 되면 전체를 다시 쓴다.
+    shift = new_stop - stop
+    old_sorted = [i if i < start else (i + shift if i >= stop else None) for i in sorted_positions(old_rows)]
+    new_sorted = [i if not start <= i < new_stop else None for i in order]
+    first = next(
+        (k for k, (old_i, new_i) in enumerate(zip(old_sorted, new_sorted)) if old_i != new_i),
+        min(len(old_sorted), len(new_sorted)),
+    )
+    patches = [(k, sorted_inventory[k]) for k in range(first) if new_sorted[k] is None]
+    if len(old_sorted) == len(new_sorted) == first:
+        rewritten = patch_binary_records(binary_file, patches, key)
+    else:
+        rewritten = (patch_binary_records(binary_file, patches, key)
+                     and rewrite_binary_tail(binary_file, sorted_inventory, first))
+    if rewritten:
+        stamp_binary_source(binary_file, source)
+    else:
+        save_to_binary(binary_file, sorted_inventory, source)
+
+    if not append_snapshot_delta(snapshot_path, snapshot['generation'], delta):
+        save_snapshot(snapshot_path, headers, inventory)
+    return True
+
+
+def read_binary_file(file_path, start=0, stop=None):
+    try:
+        with InventoryBinaryFile(file_path) as binary_file:
             print('\n[5] 저장된 이진 파일 내용:')
-            content = file.read().decode('utf-8')
-            print(content)
+            for item in binary_file.records(start, stop):
+                print(','.join('' if item[key] is None else str(item[key]) for key in binary_file.headers))
     except Exception as e:
         print('이진 파일 읽기 오류:', e)
 
@@ -77,28 +976,146 @@ def main():
     csv_file = 'Mars_Base_Inventory_List.csv'
     danger_csv_file = 'Mars_Base_Inventory_danger.csv'
     binary_file = 'Mars_Base_Inventory_List.bin'
+    snapshot_file = 'Mars_Base_Inventory_snapshot.json'
+
+    parser = argparse.ArgumentParser(description='화성 기지 인벤토리 위험 물질 분류')
+    parser.add_argument('--quiet', action='store_true',
+                        help='읽은 CSV 내용을 출력하지 않는다 (대용량 파일 처리용)')
+    parser.add_argument('--infer-types', action='store_true',
+                        help='모든 열의 타입을 추론하여 숫자 열을 실수로 읽는다 (Various 등은 빈 값)')
+    parser.add_argument('--top-k', type=int, metavar='K',
+                        help='CSV를 스트리밍으로 읽어 인화성이 가장 높은 K개만 출력한다')
+    parser.add_argument('--threshold', type=float,
+                        help='CSV를 스트리밍으로 읽어 인화성이 THRESHOLD 이상인 항목만 출력한다')
+    parser.add_argument('--between', nargs=2, type=float, metavar=('LOW', 'HIGH'),
+                        help='인화성 색인을 이용해 LOW 이상 HIGH 이하인 항목만 출력한다')
+    parser.add_argument('--use-index', action='store_true',
+                        help='--threshold 조회에 인화성 순으로 저장된 이진 파일을 색인으로 사용한다')
+    parser.add_argument('--batch', metavar='DIR',
+                        help='디렉터리의 인벤토리 CSV를 모두 병렬로 읽어 하나의 위험 물질 보고서를 만든다')
+    parser.add_argument('--workers', type=int, default=0, help='--batch에서 사용할 프로세스 수 (0이면 CPU 코어 수)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='지난 실행의 스냅샷과 비교하여 바뀐 항목만 출력 파일에 반영한다')
+    parser.add_argument('--columnar', action='store_true',
+                        help='numpy 열 단위 백엔드로 정렬과 필터링을 수행한다')
+    args = parser.parse_args()
+
+    # 일괄 처리 모드: 여러 기지의 인벤토리를 병합하여 위험 물질 목록 하나를 만든다.
+    if args.batch is not None:
+        try:
+            headers, merged = load_inventory_directory(args.batch, args.workers)
+        except Exception as e:
+            print('인벤토리 일괄 처리 오류:', e)
+            return
+        threshold = args.threshold if args.threshold is not None else 0.7
+        # 병합 결과가 인화성 순이므로 threshold 미만이 나오는 곳에서 멈추면 된다.
+        danger_list = list(itertools.takewhile(lambda item: _flammability_key(item) >= threshold, merged))
+        print(f'[일괄 처리] 전체 {len(merged)}개 항목 중 인화성 {threshold} 이상 {len(danger_list)}개')
+        if not args.quiet:
+            for item in danger_list:
+                print(item)
+        if danger_list:
+            save_to_csv(danger_csv_file, danger_list, headers)
+        return
+
+    # 색인 조회 모드: 인화성 순으로 저장된 이진 파일에서 이진 탐색으로 필요한 구간만 읽는다.
+    if args.between is not None or (args.use_index and args.threshold is not None):
+        try:
+            schema = None if args.infer_types else DEFAULT_SCHEMA
+            with load_flammability_index(csv_file, binary_file, schema) as index:
+                if args.between is not None:
+                    low, high = args.between
+                    print(f'[인화성 {low} 이상 {high} 이하 물질 목록]')
+                    result = index.between(low, high)
+                else:
+                    print(f'[인화성 {args.threshold} 이상 위험 물질 목록]')
+                    result = index.at_least(args.threshold)
+        except Exception as e:
+            print('색인 조회 오류:', e)
+            return
+        for item in result:
+            print(item)
+        return
+
+    # 조회 모드: 전체를 메모리에 올리거나 정렬하지 않고 파일에서 바로 골라낸다.
+    if args.top_k is not None or args.threshold is not None:
+        schema = None if args.infer_types else DEFAULT_SCHEMA
+        try:
+            if args.top_k is not None:
+                print(f'[인화성 상위 {args.top_k}개]')
+                result = top_k_flammable(iter_csv(csv_file, schema), args.top_k)
+            else:
+                print(f'[인화성 {args.threshold} 이상 위험 물질 목록]')
+                result = select_dangerous_materials(iter_csv(csv_file, schema), args.threshold)
+        except Exception as e:
+            print('CSV 파일 읽기 오류:', e)
+            return
+        for item in result:
+            print(item)
+        return
+
+    schema = None if args.infer_types else DEFAULT_SCHEMA
+    if args.columnar and np is None:
+        print('numpy가 설치되어 있지 않아 기본 방식으로 처리합니다.')
+        args.columnar = False
 
     # 1~2단계: CSV 읽기 + 리스트 변환 + 출력
-    inventory = read_csv(csv_file)
+    # --columnar이면 딕셔너리 목록을 거치지 않고 CSV에서 바로 열 단위로 읽는다.
+    # 증분 처리는 스냅샷과 비교할 행 목록이 필요하므로 기존 방식으로 읽는다.
+    columns = None
+    if args.columnar and not args.incremental:
+        columns = read_csv_columns(csv_file, verbose=not args.quiet, schema=schema)
+        inventory = []
+    else:
+        inventory = read_csv(csv_file, verbose=not args.quiet, schema=schema)
+
+    if args.incremental:
+        try:
+            if update_incrementally(inventory, snapshot_file, danger_csv_file, binary_file, source=csv_file):
+                return
+        except Exception as e:
+            print('증분 처리 오류:', e)
+        print('[증분 처리] 스냅샷을 사용할 수 없어 전체를 다시 처리합니다.')
+        if args.columnar and inventory:
+            columns = InventoryColumns.from_rows(inventory)
 
-    # 3단계: 인화성 높은 순 정렬
-    sorted_inventory = sort_by_flammability(inventory)
+    if columns is not None and len(columns) > 0:
+        # 3~5단계를 열 단위 배열 연산(argsort, 불리언 마스크)으로 처리하고 결과도 열에서 바로 저장한다.
+        columns = columns.sort_by_flammability()
+        danger_columns = columns.filter_dangerous_materials()
 
-    # 4단계: 인화성 ≥ 0.7 항목만 필터링하여 출력
-    danger_list = filter_dangerous_materials(sorted_inventory)
+        print('\n[3] 인화성 0.7 이상 위험 물질 목록:')
+        for item in danger_columns.to_rows():
+            print(item)
 
-    print('\n[3] 인화성 0.7 이상 위험 물질 목록:')
-    for item in danger_list:
-        print(item)
+        if len(danger_columns) > 0:
+            danger_columns.save_to_csv(danger_csv_file)
 
-    # 5단계: 위험 물질을 CSV 파일로 저장
-    if len(danger_list) > 0:
-        save_to_csv(danger_csv_file, danger_list, list(danger_list[0].keys()))
+        columns.save_to_binary(binary_file, csv_file)
+    else:
+        # 3단계: 인화성 높은 순 정렬
+        sorted_inventory = sort_by_flammability(inventory)
 
-    # 보너스: 이진 파일로 저장 및 출력
-    save_to_binary(binary_file, sorted_inventory)
+        # 4단계: 인화성 ≥ 0.7 항목만 필터링하여 출력
+        danger_list = filter_dangerous_materials(sorted_inventory)
+
+        print('\n[3] 인화성 0.7 이상 위험 물질 목록:')
+        for item in danger_list:
+            print(item)
+
+        # 5단계: 위험 물질을 CSV 파일로 저장
+        if len(danger_list) > 0:
+            save_to_csv(danger_csv_file, danger_list, list(danger_list[0].keys()))
+
+        # 보너스: 이진 파일로 저장
+        save_to_binary(binary_file, sorted_inventory, csv_file)
+
+    # 보너스: 이진 파일 출력
     read_binary_file(binary_file)
 
+    if args.incremental and inventory:
+        save_snapshot(snapshot_file, list(inventory[0].keys()), inventory)
+
 
 if __name__ == '__main__':
     main()
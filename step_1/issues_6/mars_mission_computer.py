@@ -1,9 +1,489 @@
+import atexit
+import collections.abc
+import concurrent.futures
+import gzip
+import json
+import mmap
+import os
+import queue
 import random
+import shutil
+import struct
+import threading
 import time
 
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 한 번에 하나씩 만드는 set_env만 사용할 수 있다.
+    np = None
+
+
+# 환경 값별 난수 범위 (env_values와 같은 순서)
+ENV_RANGES = {
+    'mars_base_internal_temperature': (18.0, 30.0),
+    'mars_base_external_temperature': (0.0, 21.0),
+    'mars_base_internal_humidity': (50.0, 60.0),
+    'mars_base_external_illuminance': (500.0, 715.0),
+    'mars_base_internal_co2': (0.02, 0.1),
+    'mars_base_internal_oxygen': (4.0, 7.0),
+}
+
+ENV_LOG_FORMAT = '%s, %.2f, %.2f, %.2f, %.2f, %.4f, %.2f\n'
+
+
+def generate_env_samples(count, seed=None):
+    # count개의 측정값을 한 번에 만들어 {키: numpy 배열}로 반환한다.
+    # seed에는 정수나 numpy Generator를 줄 수 있고, 같은 seed는 같은 값을 만든다.
+    if np is None:
+        raise ImportError('여러 측정값을 한 번에 만들려면 numpy가 필요합니다.')
+    rng = np.random.default_rng(seed)
+    return {key: rng.uniform(low, high, count) for key, (low, high) in ENV_RANGES.items()}
+
+
+def format_env_samples(samples, start=None, interval=1.0, chunk_size=100000):
+    # 측정값 배열을 env_log.txt 형식의 문자열로 chunk_size줄씩 묶어 돌려준다.
+    # timestamp는 start(epoch 초, 기본값은 현재 시각)부터 interval초씩 증가하며,
+    # _format_log와 같이 현지 시각으로 기록한다(구간 안의 서머타임 변경은 반영하지 않는다).
+    if start is None:
+        start = time.time()
+    offset = time.localtime(start).tm_gmtoff
+    columns = [samples[key] for key in ENV_RANGES]
+    count = len(columns[0])
+    for begin in range(0, count, chunk_size):
+        end = min(begin + chunk_size, count)
+        seconds = np.floor(start + offset + np.arange(begin, end) * interval).astype('datetime64[s]')
+        timestamps = np.datetime_as_string(seconds, unit='s')
+        # 'YYYY-mm-ddTHH:MM:SS'의 'T'를 문자 배열 뷰에서 한 번에 공백으로 바꾼다.
+        timestamps.view('U1').reshape(len(timestamps), -1)[:, 10] = ' '
+        rows = zip(timestamps.tolist(), *(column[begin:end].tolist() for column in columns))
+        yield ''.join([ENV_LOG_FORMAT % row for row in rows])
+
+
+# 링 버퍼 로그: 헤더(magic, 레코드 크기, capacity, 지금까지 기록한 개수) + capacity개의 고정 크기 레코드
+ENV_RING_MAGIC = b'ENVRING1'
+ENV_RING_HEADER = struct.Struct('<8sIIQ')
+ENV_RING_RECORD = struct.Struct('<d6f')  # timestamp(epoch 초) + ENV_RANGES 순서의 환경 값 6개
+
+
+class EnvRingLog:
+    # 미리 크기를 잡아 둔 파일을 mmap으로 열고, 레코드를 순환하며 덮어쓴다.
+    # capacity개를 넘으면 가장 오래된 레코드부터 덮어쓰므로 파일 크기가 일정하고,
+    # 최근 N개는 파싱 없이 위치 계산만으로 바로 읽을 수 있다.
+
+    def __init__(self, file_path='env_log.ring', capacity=86400):
+        exists = os.path.exists(file_path) and os.path.getsize(file_path) > 0
+        self._file = open(file_path, 'r+b' if exists else 'w+b')
+        if exists:
+            # 기존 파일이면 파일에 기록된 capacity를 그대로 사용한다.
+            magic, record_size, self.capacity, _ = ENV_RING_HEADER.unpack(self._file.read(ENV_RING_HEADER.size))
+            if magic != ENV_RING_MAGIC or record_size != ENV_RING_RECORD.size:
+                self._file.close()
+                raise ValueError(f'환경 로그 링 버퍼 파일이 아닙니다: {file_path}')
+        else:
+            if capacity <= 0:
+                self._file.close()
+                raise ValueError('capacity는 1 이상이어야 합니다.')
+            self.capacity = capacity
+            self._file.write(ENV_RING_HEADER.pack(ENV_RING_MAGIC, ENV_RING_RECORD.size, capacity, 0))
+            self._file.truncate(ENV_RING_HEADER.size + capacity * ENV_RING_RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    @property
+    def total(self):
+        # 지금까지 기록한 레코드 수 (덮어쓴 것 포함)
+        return ENV_RING_HEADER.unpack_from(self._map, 0)[3]
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def _offset(self, slot):
+        return ENV_RING_HEADER.size + slot * ENV_RING_RECORD.size
+
+    def _set_total(self, total):
+        # 레코드를 먼저 쓰고 개수를 나중에 늘려, 읽는 쪽이 덜 쓰인 레코드를 보지 않게 한다.
+        struct.pack_into('<Q', self._map, ENV_RING_HEADER.size - 8, total)
+
+    def append(self, values, timestamp=None):
+        total = self.total
+        ENV_RING_RECORD.pack_into(
+            self._map, self._offset(total % self.capacity),
+            time.time() if timestamp is None else timestamp,
+            *(values[key] for key in ENV_RANGES)
+        )
+        self._set_total(total + 1)
+
+    def append_many(self, samples, timestamps):
+        # generate_env_samples 형식의 배열을 한 번에 기록한다. capacity보다 많으면 마지막 capacity개만 남는다.
+        if np is None:
+            raise ImportError('여러 측정값을 한 번에 기록하려면 numpy가 필요합니다.')
+        count = len(timestamps)
+        records = np.empty(count, dtype=self._dtype())
+        records['timestamp'] = timestamps
+        records['values'] = np.column_stack([samples[key] for key in ENV_RANGES])
+        total = self.total
+        if count > self.capacity:
+            records = records[-self.capacity:]
+            total += count - self.capacity
+        view = self._records()
+        start = total % self.capacity
+        first = min(len(records), self.capacity - start)
+        view[start:start + first] = records[:first]
+        view[:len(records) - first] = records[first:]
+        del view
+        self._set_total(total + len(records))
+
+    def latest(self, n):
+        # 최근 n개를 오래된 것부터 (timestamp, {키: 값}) 목록으로 반환한다.
+        total = self.total
+        n = min(n, total, self.capacity)
+        keys = list(ENV_RANGES)
+        result = []
+        for slot_start, slot_stop in self._slot_ranges(total, n):
+            data = self._map[self._offset(slot_start):self._offset(slot_stop)]
+            for record in ENV_RING_RECORD.iter_unpack(data):
+                result.append((record[0], dict(zip(keys, record[1:]))))
+        return result
+
+    def latest_arrays(self, n):
+        # 최근 n개를 (timestamp 배열, {키: float32 배열})로 반환한다.
+        if np is None:
+            raise ImportError('배열로 읽으려면 numpy가 필요합니다.')
+        total = self.total
+        n = min(n, total, self.capacity)
+        view = self._records()
+        records = np.concatenate([view[start:stop] for start, stop in self._slot_ranges(total, n)])
+        del view
+        values = records['values']
+        return records['timestamp'], {key: values[:, i] for i, key in enumerate(ENV_RANGES)}
+
+    def _slot_ranges(self, total, n):
+        # 최근 n개가 놓인 슬롯 구간을 오래된 것부터 최대 두 개로 나누어 반환한다.
+        start = (total - n) % self.capacity
+        if start + n <= self.capacity:
+            return [(start, start + n)]
+        return [(start, self.capacity), (0, start + n - self.capacity)]
+
+    def _dtype(self):
+        return np.dtype([('timestamp', '<f8'), ('values', '<f4', (len(ENV_RANGES),))])
+
+    def _records(self):
+        return np.frombuffer(self._map, dtype=self._dtype(), count=self.capacity, offset=ENV_RING_HEADER.size)
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _manifest_path(file_path):
+    return os.path.splitext(file_path)[0] + '.manifest.json'
+
+
+# 같은 로그 파일에 쓰는 기록기가 여러 개여도 쓰기, 교체, 매니페스트 수정을 한 번에 하나씩 하도록
+# 경로별 잠금을 쓴다.
+_path_locks = {}
+_path_locks_guard = threading.Lock()
+
+
+def _path_lock(file_path):
+    with _path_locks_guard:
+        return _path_locks.setdefault(os.path.abspath(file_path), threading.RLock())
+
+
+def load_env_manifest(file_path='env_log.txt'):
+    # 교체된 로그 조각 목록 [{'sequence', 'file', 'start', 'end'}, ...]을 읽는다. 없으면 빈 목록.
+    try:
+        with open(_manifest_path(file_path), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return []
+
+
+def _save_env_manifest(file_path, manifest):
+    temp_path = _manifest_path(file_path) + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=4)
+    os.replace(temp_path, _manifest_path(file_path))
+
+
+def _edge_lines(file_path):
+    # 파일의 첫 줄과 마지막 줄을 읽는다. 마지막 줄은 끝에서부터 거꾸로 찾으므로 파일이 커도 빠르다.
+    with open(file_path, 'rb') as file:
+        first = file.readline()
+        position = file.seek(0, os.SEEK_END)
+        tail = b''
+        while position > 0 and tail.rfind(b'\n', 0, len(tail) - 1) == -1:
+            step = min(4096, position)
+            position -= step
+            file.seek(position)
+            tail = file.read(step) + tail
+    last = tail[tail.rfind(b'\n', 0, len(tail) - 1) + 1:]
+    return first.decode('utf-8', 'replace'), last.decode('utf-8', 'replace')
+
+
+def _line_range(text):
+    # 한 줄 이상의 로그 문자열에서 첫 줄과 마지막 줄의 timestamp를 반환한다.
+    last_line = text[text.rfind('\n', 0, len(text) - 1) + 1:]
+    return text[:19], last_line[:19]
+
+
+def query_env_log(file_path='env_log.txt', start=None, end=None):
+    # start~end('YYYY-mm-dd HH:MM:SS', 양 끝 포함) 사이의 기록을 (timestamp, {키: 값})으로 돌려준다.
+    # 매니페스트의 시간 범위가 겹치지 않는 조각은 열지 않고, 현재 로그 파일은 항상 읽는다.
+    directory = os.path.dirname(file_path)
+    paths = []
+    for segment in load_env_manifest(file_path):
+        if (start is not None and segment['end'] < start) or (end is not None and segment['start'] > end):
+            continue
+        path = os.path.join(directory, segment['file'])
+        if not os.path.exists(path) and os.path.exists(path + '.gz'):
+            path += '.gz'  # 매니페스트를 읽은 사이에 압축이 끝난 경우
+        paths.append(path)
+    paths.append(file_path)
+
+    keys = list(ENV_RANGES)
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8') as file:
+            for line in file:
+                timestamp = line[:19]
+                if (start is not None and timestamp < start) or (end is not None and timestamp > end):
+                    continue
+                values = line.rstrip('\n').split(', ')[1:]
+                yield timestamp, dict(zip(keys, map(float, values)))
+
+
+class EnvLogWriter:
+    # 로그 줄을 큐에 넣기만 하고, 백그라운드 스레드가 모아서 한꺼번에 파일에 쓴다.
+    # batch_size줄이 쌓이거나 첫 줄이 들어온 뒤 flush_interval초가 지나면 기록한다.
+    # max_bytes나 max_seconds를 주면 파일이 그보다 커지거나 오래되었을 때 env_log.000001.txt처럼
+    # 번호를 붙여 교체하고, 교체한 조각은 별도 스레드에서 gzip으로 압축한다.
+    # 조각별 시간 범위는 env_log.manifest.json에 기록하여 query_env_log가 필요한 조각만 읽게 한다.
+    # 여러 센서가 같은 파일에 기록할 때는 EnvLogWriter.shared()로 경로마다 하나인 기록기를 함께 쓴다.
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, file_path='env_log.txt'):
+        # file_path에 기록하는 공용 기록기를 반환한다. 없거나 닫혔으면 기본 설정으로 새로 만든다.
+        # 공용 기록기는 프로그램이 끝날 때 닫힌다.
+        key = os.path.abspath(file_path)
+        with cls._shared_lock:
+            writer = cls._shared.get(key)
+            if writer is None or writer._closed:
+                writer = cls(file_path)
+                writer.is_shared = True
+                cls._shared[key] = writer
+            return writer
+
+    def __init__(self, file_path='env_log.txt', batch_size=256, flush_interval=1.0,
+                 max_bytes=None, max_seconds=None, compress=True):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.compress = compress
+        self._queue = queue.Queue()
+        self._closed = False
+        self.is_shared = False
+        self._path_lock = _path_lock(file_path)
+        # 압축 스레드 풀은 미리 만들어 둔다. 종료 처리 중에는 새로 만들 수 없다.
+        self._compressor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if compress else None
+        self._segment_range = None
+        self._segment_opened = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        # 프로그램이 끝날 때 남은 기록을 잃지 않도록 종료 시 자동으로 닫는다.
+        atexit.register(self.close)
+
+    def write(self, line):
+        if self._closed:
+            raise ValueError('이미 닫힌 로그 기록기입니다.')
+        self._queue.put(line)
+
+    def flush(self, fsync=False):
+        # 지금까지 넣은 줄이 모두 파일에 기록될 때까지 기다린다. fsync=True면 디스크까지 내려보낸다.
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(('flush', fsync, done))
+        done.wait()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        done = threading.Event()
+        self._queue.put(('close', True, done))
+        done.wait()
+        self._thread.join()
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+        atexit.unregister(self.close)
+
+    def _run(self):
+        file = None
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, str):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(batch) < self.batch_size:
+                    continue
+
+            fsync = isinstance(item, tuple) and item[1]
+            try:
+                file = self._write_batch(file, batch, fsync)
+            except Exception as e:
+                file = None if file is None or file.closed else file
+                print('로그 파일 저장 중 오류:', e)
+            batch = []
+            deadline = None
+
+            if isinstance(item, tuple):
+                command, _, done = item
+                if command == 'close':
+                    if file is not None:
+                        file.close()
+                    done.set()
+                    return
+                done.set()
+
+    def _write_batch(self, file, batch, fsync):
+        # 교체 기준을 넘지 않도록 줄 경계에서 나누어 쓰고, 기준에 닿으면 조각을 교체한다.
+        # 현재 파일을 반환하며, 교체 직후에는 None을 반환한다.
+        text = ''.join(batch)
+        position = 0
+        while position < len(text):
+            with self._path_lock:
+                if file is not None and self._rotated_away(file):
+                    # 같은 경로의 다른 기록기가 이미 교체했으면 새 파일을 연다.
+                    file.close()
+                    file = None
+                if file is None:
+                    file = self._open_segment()
+                stop = len(text)
+                if self.max_bytes is not None and stop - position > self.max_bytes - file.tell():
+                    stop = text.rfind('\n', position, position + max(self.max_bytes - file.tell(), 0)) + 1
+                    if stop <= position:
+                        if file.tell() > 0:
+                            # 남은 공간에 한 줄도 들어가지 않으면 먼저 교체한다.
+                            self._close_segment(file, fsync)
+                            file = None
+                            continue
+                        stop = text.find('\n', position) + 1 or len(text)  # 빈 파일에는 긴 줄도 한 줄은 쓴다
+                part = text[position:stop]
+                position = stop
+                file.write(part)
+                file.flush()
+                self._track_range([part])
+                if self._should_rotate(file):
+                    self._close_segment(file, fsync)
+                    file = None
+        if fsync and file is not None:
+            os.fsync(file.fileno())
+        return file
+
+    def _rotated_away(self, file):
+        # 열어 둔 파일이 더 이상 file_path가 아니면(다른 기록기가 이름을 바꿈) True
+        try:
+            current = os.stat(self.file_path)
+        except FileNotFoundError:
+            return True
+        opened = os.fstat(file.fileno())
+        return (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino)
+
+    def _close_segment(self, file, fsync):
+        if fsync:
+            os.fsync(file.fileno())
+        file.close()
+        self._rotate()
+
+    def _open_segment(self):
+        file = open(self.file_path, 'a', encoding='utf-8')
+        self._segment_opened = time.time()
+        self._segment_range = None
+        if file.tell() > 0:
+            # 이전 실행에서 남은 내용이 있으면 첫 줄과 마지막 줄의 timestamp를 범위로 잡고,
+            # 첫 줄의 시각(로컬 시간)부터 max_seconds를 센다. 다시 시작해도 나이가 이어진다.
+            first, last = _edge_lines(self.file_path)
+            self._segment_range = (first[:19], last[:19])
+            try:
+                self._segment_opened = time.mktime(time.strptime(first[:19], '%Y-%m-%d %H:%M:%S'))
+            except ValueError:
+                self._segment_opened = os.path.getmtime(self.file_path)
+        return file
+
+    def _track_range(self, batch):
+        for text in batch:
+            first, last = _line_range(text)
+            if self._segment_range is None:
+                self._segment_range = (first, last)
+            else:
+                self._segment_range = (min(self._segment_range[0], first), max(self._segment_range[1], last))
+
+    def _should_rotate(self, file):
+        if self.max_bytes is not None and file.tell() >= self.max_bytes:
+            return True
+        return self.max_seconds is not None and time.time() - self._segment_opened >= self.max_seconds
+
+    def _rotate(self):
+        root, ext = os.path.splitext(self.file_path)
+        with self._path_lock:
+            manifest = load_env_manifest(self.file_path)
+            sequence = max((segment['sequence'] for segment in manifest), default=0) + 1
+            segment_path = f'{root}.{sequence:06d}{ext}'
+            os.replace(self.file_path, segment_path)
+            start, end = self._segment_range
+            manifest.append({'sequence': sequence, 'file': os.path.basename(segment_path),
+                             'start': start, 'end': end})
+            _save_env_manifest(self.file_path, manifest)
+        if self.compress:
+            try:
+                self._compressor.submit(self._compress_segment, segment_path)
+            except RuntimeError:
+                # 인터프리터 종료 중(atexit)에는 스레드 풀에 넣을 수 없으므로 바로 압축한다.
+                self._compress_segment(segment_path)
+
+    def _compress_segment(self, segment_path):
+        # 압축이 끝난 뒤 매니페스트의 파일 이름을 바꾸고 나서 원본을 지운다.
+        try:
+            with open(segment_path, 'rb') as source, gzip.open(segment_path + '.gz.tmp', 'wb') as target:
+                shutil.copyfileobj(source, target)
+            os.replace(segment_path + '.gz.tmp', segment_path + '.gz')
+            with self._path_lock:
+                manifest = load_env_manifest(self.file_path)
+                for segment in manifest:
+                    if segment['file'] == os.path.basename(segment_path):
+                        segment['file'] += '.gz'
+                _save_env_manifest(self.file_path, manifest)
+            os.remove(segment_path)
+        except Exception as e:
+            print('로그 파일 압축 중 오류:', e)
+
 
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_writer=None, ring_log=None):
         self.env_values = {
             'mars_base_internal_temperature': 0.0,
             'mars_base_external_temperature': 0.0,
@@ -12,25 +492,60 @@ class DummySensor:
             'mars_base_internal_co2': 0.0,
             'mars_base_internal_oxygen': 0.0
         }
+        # 기록기를 넘기지 않으면 env_log.txt의 공용 기록기를 다른 센서와 함께 쓴다.
+        self.log_writer = log_writer if log_writer is not None else EnvLogWriter.shared()
+        # EnvRingLog를 넘기면 텍스트 로그와 함께 고정 크기 이진 로그에도 기록한다.
+        self.ring_log = ring_log
 
     def set_env(self):
-        self.env_values['mars_base_internal_temperature'] = random.uniform(18.0, 30.0)
-        self.env_values['mars_base_external_temperature'] = random.uniform(0.0, 21.0)
-        self.env_values['mars_base_internal_humidity'] = random.uniform(50.0, 60.0)
-        self.env_values['mars_base_external_illuminance'] = random.uniform(500.0, 715.0)
-        self.env_values['mars_base_internal_co2'] = random.uniform(0.02, 0.1)
-        self.env_values['mars_base_internal_oxygen'] = random.uniform(4.0, 7.0)
+        for key, (low, high) in ENV_RANGES.items():
+            self.env_values[key] = random.uniform(low, high)
+
+    def set_env_batch(self, count, seed=None):
+        # count개의 측정값을 한 번에 만들고, env_values는 마지막 측정값으로 맞춘다.
+        samples = generate_env_samples(count, seed)
+        if count > 0:
+            for key in ENV_RANGES:
+                self.env_values[key] = float(samples[key][-1])
+        return samples
 
     def get_env(self):
         try:
-            log_line = self._format_log()
-            with open('env_log.txt', 'a', encoding='utf-8') as file:
-                file.write(log_line + '\n')
+            self.log_writer.write(self._format_log() + '\n')
+            if self.ring_log is not None:
+                self.ring_log.append(self.env_values)
         except Exception as e:
             print('로그 파일 저장 중 오류:', e)
 
         return self.env_values
 
+    def get_env_batch(self, samples, start=None, interval=1.0):
+        # set_env_batch로 만든 측정값을 줄 단위가 아닌 큰 묶음으로 로그에 기록한다.
+        if start is None:
+            start = time.time()
+        try:
+            for chunk in format_env_samples(samples, start, interval):
+                self.log_writer.write(chunk)
+            if self.ring_log is not None:
+                count = len(samples['mars_base_internal_temperature'])
+                self.ring_log.append_many(samples, start + np.arange(count) * interval)
+        except Exception as e:
+            print('로그 파일 저장 중 오류:', e)
+
+        return samples
+
+    def flush(self, fsync=False):
+        self.log_writer.flush(fsync)
+        if self.ring_log is not None:
+            self.ring_log.flush()
+
+    def close(self):
+        # 공용 기록기는 다른 센서도 쓰므로 닫지 않고 디스크까지 내려보내기만 한다.
+        if self.log_writer.is_shared:
+            self.log_writer.flush(fsync=True)
+        else:
+            self.log_writer.close()
+
     def _format_log(self):
         now = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
         values = self.env_values
@@ -46,6 +561,100 @@ class DummySensor:
         return log
 
 
+class EnvValuesView(collections.abc.Mapping):
+    # 함대 배열의 한 행을 env_values 딕셔너리처럼 읽고 쓰게 해 준다. 값은 복사하지 않는다.
+
+    _columns = {key: i for i, key in enumerate(ENV_RANGES)}
+
+    def __init__(self, row):
+        self._row = row
+
+    def __getitem__(self, key):
+        return float(self._row[self._columns[key]])
+
+    def __setitem__(self, key, value):
+        self._row[self._columns[key]] = value
+
+    def __iter__(self):
+        return iter(ENV_RANGES)
+
+    def __len__(self):
+        return len(ENV_RANGES)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class FleetSensor(DummySensor):
+    # DummySensorFleet의 센서 하나를 DummySensor처럼 쓰게 해 주는 뷰.
+    # 환경 값은 함대 배열의 한 행이고, 로그 기록기는 함대와 함께 쓴다.
+
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+        self.env_values = EnvValuesView(fleet.values[index])
+        self.log_writer = fleet.log_writer
+        self.ring_log = None
+
+    def set_env(self):
+        self.fleet.values[self.index] = self.fleet.draw(1)[0]
+
+
+class DummySensorFleet:
+    # 센서 count개의 환경 값을 (센서, 항목) 모양의 2차원 배열 하나에 모아 두고
+    # 전체를 한 번의 난수 생성으로 갱신한다. 센서마다 객체와 딕셔너리를 만들지 않는다.
+
+    def __init__(self, count, seed=None, log_writer=None):
+        if np is None:
+            raise ImportError('센서 묶음을 만들려면 numpy가 필요합니다.')
+        self.values = np.zeros((count, len(ENV_RANGES)))
+        self._rng = np.random.default_rng(seed)
+        bounds = np.array(list(ENV_RANGES.values()))
+        self._low = bounds[:, 0]
+        self._span = bounds[:, 1] - bounds[:, 0]
+        self.log_writer = log_writer if log_writer is not None else EnvLogWriter.shared()
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return FleetSensor(self, index)
+
+    def __iter__(self):
+        return (FleetSensor(self, index) for index in range(len(self.values)))
+
+    def draw(self, count):
+        # (count, 항목) 모양으로 ENV_RANGES 범위의 값을 만든다.
+        return self._low + self._rng.random((count, len(ENV_RANGES))) * self._span
+
+    def set_env(self):
+        # 새 배열을 만들지 않고 기존 배열에 바로 채운다.
+        self._rng.random(out=self.values)
+        self.values *= self._span
+        self.values += self._low
+
+    def column(self, key):
+        # 모든 센서의 한 항목 값 (복사하지 않은 뷰)
+        return self.values[:, list(ENV_RANGES).index(key)]
+
+    def get_env(self):
+        # 모든 센서의 현재 값을 같은 timestamp로 센서 순서대로 한꺼번에 기록한다.
+        samples = {key: self.values[:, i] for i, key in enumerate(ENV_RANGES)}
+        try:
+            for chunk in format_env_samples(samples, time.time(), 0.0):
+                self.log_writer.write(chunk)
+        except Exception as e:
+            print('로그 파일 저장 중 오류:', e)
+
+        return self.values
+
+    def flush(self, fsync=False):
+        self.log_writer.flush(fsync)
+
+    def close(self):
+        DummySensor.close(self)
+
+
 # 인스턴스 생성 및 테스트
 if __name__ == '__main__':
     ds = DummySensor()
@@ -55,3 +664,5 @@ if __name__ == '__main__':
     print('[현재 센서 데이터]')
     for key in values:
         print(key + ':', round(values[key], 2))
+
+    ds.close()